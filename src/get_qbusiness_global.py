@@ -6,41 +6,263 @@ This script retrieves comprehensive information about Q Business applications in
 - Application configuration (identity, security, settings)
 - Data sources, retrievers, and plugins
 - Chat controls (blocked phrases, topics, guardrails)
-- All combined in a single CSV/JSON export
+- Exported as one CSV per normalized table plus NDJSON (or one wide CSV/JSON with --denormalized)
 
 Features:
 - Complete Q Business application inventory
 - Q Apps with usage metrics
 - Full configuration details
 - Chat controls and topic configurations
-- Single unified export file
+- Normalized CSV tables (applications, qapps, indices, data_sources, retrievers, plugins,
+  topics, blocked_phrases) linked by app_id, streamed as applications are processed
 
 Usage:
     python get_qbusiness_global.py [--config path/to/config.yml] [--env path/to/.env]
+                                  [--async] [--pretty] [--denormalized]
 
 Date: January 9, 2025
 """
 
 import os
+import sys
 import csv
+import copy
 import json
+import time
+import queue
+import logging
+import hashlib
+import asyncio
 import argparse
+import textwrap
+import operator
+import functools
+import itertools
+import multiprocessing
+from contextlib import AsyncExitStack, ExitStack
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 
 import boto3
 import yaml
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 from dotenv import load_dotenv
 
+try:
+    import aioboto3
+except ImportError:  # Optional dependency, only needed for --async
+    aioboto3 = None
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, faster JSON export
+    orjson = None
+
+
+log = logging.getLogger(__name__)
+
+# Local caches live beside the script (src/output/.cache, git-ignored), whatever the working directory
+CACHE_DIR = Path(__file__).resolve().parent / 'output' / '.cache'
+
+# Caller identity cache (avoids an STS round-trip on every run), shared with the enhanced exporter
+STS_CACHE_PATH = CACHE_DIR / 'sts_identity.json'
+STS_CACHE_TTL_SECONDS = 12 * 60 * 60
+
+# Describe-response cache (reused on later runs while a resource's updatedAt is unchanged)
+DESCRIBE_CACHE_DIR = CACHE_DIR / 'describe'
+
+# Error codes AWS uses for throttling (retried by botocore; re-raised if retries run out)
+_THROTTLING_ERROR_CODES = frozenset({
+    'Throttling', 'ThrottlingException', 'ThrottledException', 'TooManyRequestsException',
+    'RequestThrottled', 'RequestThrottledException', 'RequestLimitExceeded', 'SlowDown',
+})
+
+# Write buffer for export files (wide rows would otherwise hit the disk every few rows)
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Export columns, in output order (keys of the row built by _create_global_row)
+FIELDNAMES = (
+    # Q App information
+    'qapp_name', 'qapp_id', 'qapp_library_item_id', 'qapp_version', 'qapp_status',
+    'qapp_user_count', 'qapp_owner_created_by', 'qapp_created_at', 'qapp_updated_by',
+    'qapp_updated_at', 'qapp_rating_count', 'qapp_is_verified', 'qapp_is_rated_by_user',
+    'qapp_description', 'qapp_categories',
+    # Application basic info
+    'app_name', 'app_id', 'app_arn', 'app_description', 'app_status', 'app_created_at',
+    'app_updated_at',
+    # Identity & security
+    'identity_type', 'identity_center_arn', 'iam_identity_provider_arn', 'client_ids_for_oidc',
+    'role_arn', 'encryption_kms_key',
+    # Application configuration
+    'attachments_mode', 'auto_subscribe', 'auto_subscribe_default', 'personalization_mode',
+    'qapps_mode', 'quicksight_namespace',
+    # Chat controls
+    'blocked_phrases_count', 'blocked_phrases', 'blocked_phrases_system_message',
+    'creator_mode_control', 'hallucination_reduction_control', 'orchestration_control',
+    'response_scope', 'topic_count', 'topic_names', 'topic_descriptions',
+    # Errors and index
+    'error_code', 'error_message', 'index_id', 'index_ids',
+    # Data sources, retrievers and plugins
+    'data_source_count', 'data_source_ids', 'data_source_types', 'data_source_names',
+    'data_source_statuses', 'retriever_count', 'retriever_ids', 'retriever_types',
+    'retriever_statuses', 'plugin_count', 'plugin_ids', 'plugin_types', 'plugin_statuses',
+    # Metadata
+    'export_timestamp', 'aws_region', 'aws_account',
+)
+_project_row = operator.itemgetter(*FIELDNAMES)
+
+# Every export column, in order; copied and filled in per application
+_ROW_TEMPLATE = dict.fromkeys(FIELDNAMES)
+
+# Normalized export (default): one CSV per table, keyed by app_id. The joined list
+# columns of the wide export become rows of their own table.
+_JOINED_FIELDS = frozenset({
+    'qapp_categories', 'blocked_phrases', 'topic_names', 'topic_descriptions', 'index_id', 'index_ids',
+    'data_source_ids', 'data_source_types', 'data_source_names', 'data_source_statuses',
+    'retriever_ids', 'retriever_types', 'retriever_statuses', 'plugin_ids', 'plugin_types', 'plugin_statuses',
+})
+NORMALIZED_TABLES = {
+    'applications': tuple(
+        field for field in FIELDNAMES if not field.startswith('qapp_') and field not in _JOINED_FIELDS
+    ),
+    'qapps': ('app_id',) + tuple(field for field in FIELDNAMES if field.startswith('qapp_')),
+    'indices': ('app_id', 'index_id'),
+    'data_sources': ('app_id', 'data_source_id', 'data_source_type', 'data_source_name', 'data_source_status'),
+    'retrievers': ('app_id', 'retriever_id', 'retriever_type', 'retriever_status'),
+    'plugins': ('app_id', 'plugin_id', 'plugin_type', 'plugin_status'),
+    'topics': ('app_id', 'topic_name', 'topic_description'),
+    'blocked_phrases': ('app_id', 'blocked_phrase'),
+}
+_project_application = operator.itemgetter(*NORMALIZED_TABLES['applications'])
+_project_qapp = operator.itemgetter(*NORMALIZED_TABLES['qapps'])
+
+# .env files already loaded by this process
+_LOADED_ENV_FILES = set()
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config(path, mtime):
+    """Parse a YAML config file; cached per absolute path and modification time"""
+    with open(path, 'r') as f:
+        return yaml.safe_load(f) or {}
+
+
+def _load_config(config_path):
+    """Load configuration from YAML file"""
+    try:
+        path = os.path.abspath(config_path)
+        return copy.deepcopy(_read_config(path, os.path.getmtime(path)))
+    except (OSError, yaml.YAMLError):
+        return {'aws': {'region': 'us-east-1'}}
+
+
+def _configure_logging():
+    """Send log records through a queue to stdout so worker threads never block on console I/O"""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.WARNING)
+    log.setLevel(logging.INFO)
+    
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
+def _load_env(env_path):
+    """Load a .env file once per process"""
+    path = os.path.abspath(env_path)
+    if path not in _LOADED_ENV_FILES:
+        load_dotenv(path)
+        _LOADED_ENV_FILES.add(path)
+
+
+def _collect(items, *keys):
+    """Join the given keys of each item into comma-separated strings in a single pass"""
+    values = {key: [] for key in keys}
+    for item in items:
+        for key in keys:
+            values[key].append(str(item.get(key, 'N/A')))
+    return {key: ', '.join(collected) for key, collected in values.items()}
+
+
+def _joinget(items, key, default='N/A'):
+    """Join one key of each item into a comma-separated string"""
+    return ', '.join([str(item.get(key, default)) for item in items])
+
+
+def _is_throttled(error):
+    """Whether a ClientError is a throttling error that outlasted the adaptive retries"""
+    return error.response.get('Error', {}).get('Code') in _THROTTLING_ERROR_CODES
+
+
+def _raise_if_throttled(error):
+    """Re-raise a throttling error that outlasted the adaptive retries instead of degrading silently"""
+    if _is_throttled(error):
+        raise error
+
+
+def get_cached_caller_identity(session, sts_client, profile, region):
+    """Get the STS caller identity, reusing a cached result while it is fresh (shared by both exporters)"""
+    credentials = session.get_credentials()
+    access_key = credentials.access_key if credentials else ''
+    cache_key = '|'.join([
+        profile or 'default',
+        region,
+        hashlib.sha256(access_key.encode('utf-8')).hexdigest()[:16]
+    ])
+    
+    try:
+        with open(STS_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    
+    entry = cache.get(cache_key)
+    if entry and time.time() - entry.get('timestamp', 0) < STS_CACHE_TTL_SECONDS:
+        return entry['identity']
+    
+    response = sts_client.get_caller_identity()
+    identity = {key: response[key] for key in ('Account', 'Arn', 'UserId')}
+    
+    cache[cache_key] = {'identity': identity, 'timestamp': time.time()}
+    try:
+        STS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(STS_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass
+    
+    return identity
+
+
+def _to_json(obj):
+    """Serialize obj as indented JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC, default=str).decode('utf-8')
+    return json.dumps(obj, indent=2, default=str)
+
+
+def _to_json_line(obj):
+    """Serialize obj as compact single-line JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC, default=str).decode('utf-8')
+    return json.dumps(obj, default=str, separators=(',', ':'))
+
 
 class QBusinessGlobalExporter:
     """Export complete Q Business application information including Q Apps and configurations"""
     
     def __init__(self, config_path='./input/config.yml', env_path='./config/.env'):
         """Initialize the exporter with configuration"""
-        self.config = self._load_config(config_path)
-        load_dotenv(env_path)
+        self.config = _load_config(config_path)
+        _load_env(env_path)
         
         # AWS settings
         self.aws_region = self.config.get('aws', {}).get('region') or os.getenv('AWS_REGION', 'us-east-1')
@@ -49,18 +271,36 @@ class QBusinessGlobalExporter:
         
         # Initialize boto3
         self.session = self._create_session()
-        self.qbusiness_client = None
-        self.qapps_client = None
+        self._client_config = self._create_client_config()
+        self.sts_client = self.session.client('sts', config=self._client_config)
+        
+        # Concurrency settings
+        self.max_workers = self.config.get('retrieval', {}).get('max_workers', 16)
+        self.detail_workers = self.config.get('retrieval', {}).get('detail_workers', 10)
         
-        self.verbose = True
+        self._create_sync_clients()
+        
+        # Days to keep describe responses on disk (0 disables the cache)
+        self.describe_cache_days = self.config.get('retrieval', {}).get('describe_cache_days', 7)
+        
+        # One timestamp per export run, shared by every row
+        self._export_ts = datetime.now().isoformat()
+        
+        # IDs of applications dropped from the export (throttled past the retries, or failed)
+        self.skipped_apps = []
+        
+        # Detailed progress output only when verbose; warnings and errors always show
+        self.verbose = self.config.get('logging', {}).get('verbose', True)
+        log.setLevel(logging.INFO if self.verbose else logging.WARNING)
     
-    def _load_config(self, config_path):
-        """Load configuration from YAML file"""
-        try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f) or {}
-        except (FileNotFoundError, yaml.YAMLError):
-            return {'aws': {'region': 'us-east-1'}}
+    def _create_sync_clients(self):
+        """Create the boto3 service clients and the describe pool used by the threaded export"""
+        # Clients are shared by all worker threads
+        self.qbusiness_client = self.session.client('qbusiness', config=self._client_config)
+        self.qapps_client = self.session.client('qapps', config=self._client_config)
+        
+        # Describe calls from every application share one pool (threads start on first use)
+        self._detail_pool = ThreadPoolExecutor(max_workers=self.detail_workers)
     
     def _create_session(self):
         """Create boto3 session"""
@@ -69,284 +309,455 @@ class QBusinessGlobalExporter:
             session_params['profile_name'] = self.aws_profile
         return boto3.Session(**session_params)
     
+    def _create_client_config(self):
+        """Create botocore client configuration for concurrent API calls"""
+        retrieval = self.config.get('retrieval', {})
+        return Config(
+            max_pool_connections=retrieval.get('max_pool_connections', 64),
+            tcp_keepalive=True,
+            retries={
+                'max_attempts': retrieval.get('retry', {}).get('max_attempts', 10),
+                'mode': 'adaptive'
+            },
+            connect_timeout=5,
+            read_timeout=30
+        )
+    
     def verify_credentials(self):
         """Verify AWS credentials"""
         try:
-            sts = self.session.client('sts')
-            identity = sts.get_caller_identity()
+            identity = self._get_caller_identity()
             
-            print("✅ AWS Credentials Verified")
-            print(f"   Account: {identity['Account']}")
-            print(f"   User/Role: {identity['Arn'].split('/')[-1]}")
-            print(f"   Region: {self.aws_region}\n")
+            log.info("✅ AWS Credentials Verified")
+            log.info(f"   Account: {identity['Account']}")
+            log.info(f"   User/Role: {identity['Arn'].split('/')[-1]}")
+            log.info(f"   Region: {self.aws_region}\n")
             return True
         except ClientError as e:
-            print(f"❌ Credential verification failed: {e}")
+            log.error(f"❌ Credential verification failed: {e}")
             return False
     
+    def _get_caller_identity(self):
+        """Get the STS caller identity, reusing a cached result while it is fresh"""
+        return get_cached_caller_identity(self.session, self.sts_client, self.aws_profile, self.aws_region)
+    
     def list_applications(self):
         """Get all Q Business applications with details"""
         try:
-            if not self.qbusiness_client:
-                self.qbusiness_client = self.session.client('qbusiness')
-            
-            print("🔍 Retrieving Q Business applications...\n")
+            log.info("🔍 Retrieving Q Business applications...\n")
+            self._purge_describe_cache()
             
             applications = []
-            next_token = None
             
-            while True:
-                params = {'maxResults': 50}
-                if next_token:
-                    params['nextToken'] = next_token
-                
-                response = self.qbusiness_client.list_applications(**params)
-                apps = response.get('applications', [])
-                
-                for app in apps:
-                    try:
-                        detail = self.qbusiness_client.get_application(
-                            applicationId=app['applicationId']
-                        )
-                        applications.append(detail)
-                    except ClientError as e:
-                        print(f"⚠️  Could not get details for {app['applicationId']}: {e}")
-                        applications.append(app)
-                
-                next_token = response.get('nextToken')
-                if not next_token:
-                    break
+            def fetch_detail(app):
+                try:
+                    return self.qbusiness_client.get_application(
+                        applicationId=app['applicationId']
+                    )
+                except ClientError as e:
+                    # A throttled describe drops only this application, never the whole listing
+                    if _is_throttled(e):
+                        log.error(f"❌ Skipping {app['applicationId']}: {e}\n")
+                        self.skipped_apps.append(app['applicationId'])
+                        return None
+                    log.warning(f"⚠️  Could not get details for {app['applicationId']}: {e}")
+                    return app
+            
+            for page in self._paginate(self.qbusiness_client, 'list_applications', 100):
+                apps = page.get('applications', [])
+                details = self._fetch_details(apps, fetch_detail, 'applications', 'applicationId')
+                applications.extend(detail for detail in details if detail is not None)
             
-            print(f"✅ Found {len(applications)} Q Business application(s)\n")
+            log.info(f"✅ Found {len(applications)} Q Business application(s)\n")
             return applications
         except ClientError as e:
-            print(f"❌ Error listing applications: {e}")
+            log.error(f"❌ Error listing applications: {e}")
             return []
     
     def get_qapps(self, application_id):
         """Get Q Apps for an application"""
         try:
-            if not self.qapps_client:
-                self.qapps_client = self.session.client('qapps')
-            
             qapps = []
-            next_token = None
             
-            while True:
-                params = {
-                    'instanceId': application_id,
-                    'limit': 100
-                }
-                if next_token:
-                    params['nextToken'] = next_token
-                
-                response = self.qapps_client.list_library_items(**params)
-                items = response.get('libraryItems', [])
-                
-                for item in items:
-                    try:
-                        detail = self.qapps_client.get_library_item(
-                            instanceId=application_id,
-                            libraryItemId=item['libraryItemId']
-                        )
-                        qapps.append(detail)
-                    except ClientError as e:
-                        qapps.append(item)
-                
-                next_token = response.get('nextToken')
-                if not next_token:
-                    break
+            # Library item summaries already carry every field get_library_item returns
+            for page in self._paginate(self.qapps_client, 'list_library_items', 100,
+                                       size_param='limit', instanceId=application_id):
+                qapps.extend(page.get('libraryItems', []))
             
             return qapps
-        except ClientError:
+        except ClientError as e:
+            _raise_if_throttled(e)
+            return []
+    
+    def get_index_ids(self, application_id):
+        """Get the IDs of all indices for an application"""
+        try:
+            index_ids = []
+            for page in self._paginate(self.qbusiness_client, 'list_indices', 100,
+                                       applicationId=application_id):
+                index_ids.extend(index['indexId'] for index in page.get('indices', []))
+            return index_ids
+        except ClientError as e:
+            _raise_if_throttled(e)
             return []
     
-    def get_data_sources(self, application_id, index_id):
-        """Get data sources"""
+    def get_data_sources(self, application_id, index_id, fetch_details=False):
+        """Get data sources (list summaries unless fetch_details is set)"""
         try:
             data_sources = []
-            next_token = None
             
-            while True:
-                params = {
-                    'applicationId': application_id,
-                    'indexId': index_id,
-                    'maxResults': 10
-                }
-                if next_token:
-                    params['nextToken'] = next_token
-                
-                response = self.qbusiness_client.list_data_sources(**params)
-                sources = response.get('dataSources', [])
-                
-                for source in sources:
-                    try:
-                        detail = self.qbusiness_client.get_data_source(
-                            applicationId=application_id,
-                            indexId=index_id,
-                            dataSourceId=source['dataSourceId']
-                        )
-                        data_sources.append(detail)
-                    except ClientError:
-                        data_sources.append(source)
-                
-                next_token = response.get('nextToken')
-                if not next_token:
-                    break
+            def fetch_detail(source):
+                try:
+                    return self.qbusiness_client.get_data_source(
+                        applicationId=application_id,
+                        indexId=index_id,
+                        dataSourceId=source['dataSourceId']
+                    )
+                except ClientError as e:
+                    _raise_if_throttled(e)
+                    return source
+            
+            # list_data_sources accepts at most 10 results per page
+            for page in self._paginate(self.qbusiness_client, 'list_data_sources', 10,
+                                       applicationId=application_id, indexId=index_id):
+                sources = page.get('dataSources', [])
+                if fetch_details:
+                    sources = self._fetch_details(sources, fetch_detail, 'data_sources', 'dataSourceId')
+                data_sources.extend(sources)
             
             return data_sources
-        except ClientError:
+        except ClientError as e:
+            _raise_if_throttled(e)
             return []
     
-    def get_retrievers(self, application_id):
-        """Get retrievers"""
+    def get_retrievers(self, application_id, fetch_details=False):
+        """Get retrievers (list summaries unless fetch_details is set)"""
         try:
             retrievers = []
-            next_token = None
             
-            while True:
-                params = {
-                    'applicationId': application_id,
-                    'maxResults': 50
-                }
-                if next_token:
-                    params['nextToken'] = next_token
-                
-                response = self.qbusiness_client.list_retrievers(**params)
-                ret_list = response.get('retrievers', [])
-                
-                for retriever in ret_list:
-                    try:
-                        detail = self.qbusiness_client.get_retriever(
-                            applicationId=application_id,
-                            retrieverId=retriever['retrieverId']
-                        )
-                        retrievers.append(detail)
-                    except ClientError:
-                        retrievers.append(retriever)
-                
-                next_token = response.get('nextToken')
-                if not next_token:
-                    break
+            def fetch_detail(retriever):
+                try:
+                    return self.qbusiness_client.get_retriever(
+                        applicationId=application_id,
+                        retrieverId=retriever['retrieverId']
+                    )
+                except ClientError as e:
+                    _raise_if_throttled(e)
+                    return retriever
+            
+            for page in self._paginate(self.qbusiness_client, 'list_retrievers', 50,
+                                       applicationId=application_id):
+                ret_list = page.get('retrievers', [])
+                if fetch_details:
+                    ret_list = self._fetch_details(ret_list, fetch_detail, 'retrievers', 'retrieverId')
+                retrievers.extend(ret_list)
             
             return retrievers
-        except ClientError:
+        except ClientError as e:
+            _raise_if_throttled(e)
             return []
     
-    def get_plugins(self, application_id):
-        """Get plugins"""
+    def get_plugins(self, application_id, fetch_details=False):
+        """Get plugins (list summaries unless fetch_details is set)"""
         try:
             plugins = []
-            next_token = None
             
-            while True:
-                params = {
-                    'applicationId': application_id,
-                    'maxResults': 50
-                }
-                if next_token:
-                    params['nextToken'] = next_token
-                
-                response = self.qbusiness_client.list_plugins(**params)
-                plugin_list = response.get('plugins', [])
-                
-                for plugin in plugin_list:
-                    try:
-                        detail = self.qbusiness_client.get_plugin(
-                            applicationId=application_id,
-                            pluginId=plugin['pluginId']
-                        )
-                        plugins.append(detail)
-                    except ClientError:
-                        plugins.append(plugin)
-                
-                next_token = response.get('nextToken')
-                if not next_token:
-                    break
+            def fetch_detail(plugin):
+                try:
+                    return self.qbusiness_client.get_plugin(
+                        applicationId=application_id,
+                        pluginId=plugin['pluginId']
+                    )
+                except ClientError as e:
+                    _raise_if_throttled(e)
+                    return plugin
+            
+            for page in self._paginate(self.qbusiness_client, 'list_plugins', 50,
+                                       applicationId=application_id):
+                plugin_list = page.get('plugins', [])
+                if fetch_details:
+                    plugin_list = self._fetch_details(plugin_list, fetch_detail, 'plugins', 'pluginId')
+                plugins.extend(plugin_list)
             
             return plugins
-        except ClientError:
+        except ClientError as e:
+            _raise_if_throttled(e)
             return []
     
+    def _paginate(self, client, operation, page_size, size_param='maxResults', **params):
+        """Yield result pages of a list operation, using the botocore paginator when available"""
+        if client.can_paginate(operation):
+            paginator = client.get_paginator(operation)
+            yield from paginator.paginate(PaginationConfig={'PageSize': page_size}, **params)
+            return
+        
+        # Fall back to a manual nextToken loop
+        method = getattr(client, operation)
+        params[size_param] = page_size
+        while True:
+            response = method(**params)
+            yield response
+            next_token = response.get('nextToken')
+            if not next_token:
+                break
+            params['nextToken'] = next_token
+    
+    def _fetch_details(self, items, fetch_detail, cache_type, id_key):
+        """Run fetch_detail over one page of list results on the shared pool, preserving order"""
+        def cached_fetch(item):
+            detail = self._read_describe_cache(cache_type, item.get(id_key), item.get('updatedAt'))
+            if detail is not None:
+                return {**detail, **item}
+            detail = fetch_detail(item)
+            if detail is not None and detail is not item:
+                self._write_describe_cache(cache_type, item.get(id_key), item.get('updatedAt'), detail)
+            return detail
+        
+        return list(self._detail_pool.map(cached_fetch, items))
+    
+    def _read_describe_cache(self, cache_type, item_id, updated_at):
+        """Return a cached describe response if the resource has not been updated since, else None"""
+        if not self.describe_cache_days or not item_id or updated_at is None:
+            return None
+        try:
+            with open(DESCRIBE_CACHE_DIR / cache_type / f"{item_id}.json", 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('updatedAt') != str(updated_at):
+            return None
+        return entry.get('response')
+    
+    def _write_describe_cache(self, cache_type, item_id, updated_at, response):
+        """Store a describe response keyed by resource ID and updatedAt"""
+        if not self.describe_cache_days or not item_id or updated_at is None:
+            return
+        response = {key: value for key, value in response.items() if key != 'ResponseMetadata'}
+        try:
+            cache_dir = DESCRIBE_CACHE_DIR / cache_type
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_dir / f"{item_id}.json", 'w', encoding='utf-8') as f:
+                json.dump({'updatedAt': str(updated_at), 'response': response}, f, default=str)
+        except OSError:
+            pass
+    
+    def _purge_describe_cache(self):
+        """Delete describe cache entries older than describe_cache_days"""
+        if not self.describe_cache_days:
+            return
+        cutoff = time.time() - self.describe_cache_days * 24 * 60 * 60
+        for path in DESCRIBE_CACHE_DIR.glob('*/*.json'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+    
     def get_chat_controls(self, application_id):
-        """Get chat controls configuration"""
+        """Get chat controls configuration, including every page of topic configurations"""
         try:
-            response = self.qbusiness_client.get_chat_controls_configuration(
-                applicationId=application_id,
-                maxResults=50
-            )
-            return response
-        except ClientError:
+            chat_controls = {}
+            topic_configs = []
+            for page in self._paginate(self.qbusiness_client, 'get_chat_controls_configuration', 50,
+                                       applicationId=application_id):
+                chat_controls = chat_controls or page
+                topic_configs.extend(page.get('topicConfigurations', []))
+            if chat_controls:
+                chat_controls['topicConfigurations'] = topic_configs
+            return chat_controls
+        except ClientError as e:
+            _raise_if_throttled(e)
             return {}
     
     def export_all_data(self):
         """Export complete Q Business data including Q Apps and configurations"""
-        all_data = []
+        return list(self.iter_rows())
+    
+    def iter_rows(self):
+        """Yield data rows as each application finishes processing"""
+        for application in self.iter_applications():
+            yield from self._build_application_rows(application)
+    
+    def iter_applications(self):
+        """Yield the retrieved data of each application as soon as it is complete"""
         include_empty = self.config.get('export', {}).get('include_empty_apps', True)
+        self._export_ts = datetime.now().isoformat()
+        self.skipped_apps = []
         
         # Get all applications
         applications = self.list_applications()
         
-        for app in applications:
-            app_id = app.get('applicationId', 'N/A')
-            app_name = app.get('displayName', app_id)
-            
-            print(f"📊 Processing: {app_name}")
+        # List calls that do not depend on each other, per application
+        calls = {
+            'index_ids': self.get_index_ids,
+            'retrievers': self.get_retrievers,
+            'plugins': self.get_plugins,
+            'chat_controls': self.get_chat_controls,
+        }
+        
+        # Every application's calls share one pool, so all applications are in flight together;
+        # rows are handed on as soon as the last call of an application finishes
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = [{} for _ in applications]
+            remaining = [0] * len(applications)
+            owners = {}
+            pending = set()
             
-            # Get index ID
-            index_id = None
-            try:
-                indices = self.qbusiness_client.list_indices(
-                    applicationId=app_id,
-                    maxResults=10
-                )
-                if indices.get('indices'):
-                    index_id = indices['indices'][0]['indexId']
-            except ClientError:
-                pass
+            def submit(i, name, call, *args):
+                future = executor.submit(call, applications[i].get('applicationId', 'N/A'), *args)
+                owners[future] = (i, name)
+                pending.add(future)
+                remaining[i] += 1
             
-            # Get Q Apps
-            print(f"   📱 Retrieving Q Apps...")
-            qapps = self.get_qapps(app_id)
-            print(f"      ✅ Found {len(qapps)} Q App(s)")
+            # Without include_empty, the other calls wait until an application is known to have Q Apps
+            for i in range(len(applications)):
+                submit(i, 'qapps', self.get_qapps)
+                if include_empty:
+                    for name, call in calls.items():
+                        submit(i, name, call)
             
-            # Get data sources
-            data_sources = []
-            if index_id:
-                print(f"   📁 Retrieving data sources...")
-                data_sources = self.get_data_sources(app_id, index_id)
-                print(f"      ✅ Found {len(data_sources)} data source(s)")
-            
-            # Get retrievers
-            print(f"   🔍 Retrieving retrievers...")
-            retrievers = self.get_retrievers(app_id)
-            print(f"      ✅ Found {len(retrievers)} retriever(s)")
-            
-            # Get plugins
-            print(f"   🔌 Retrieving plugins...")
-            plugins = self.get_plugins(app_id)
-            print(f"      ✅ Found {len(plugins)} plugin(s)")
-            
-            # Get chat controls
-            print(f"   💬 Retrieving chat controls...")
-            chat_controls = self.get_chat_controls(app_id)
-            print(f"      ✅ Chat controls retrieved")
-            
-            # Create rows
-            if qapps:
-                for qapp in qapps:
-                    row = self._create_global_row(app, qapp, data_sources, retrievers, plugins, index_id, chat_controls)
-                    all_data.append(row)
-            elif include_empty:
-                row = self._create_global_row(app, None, data_sources, retrievers, plugins, index_id, chat_controls)
-                all_data.append(row)
-            
-            print()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending -= done
+                for future in done:
+                    i, name = owners.pop(future)
+                    app = applications[i]
+                    app_id = app.get('applicationId', 'N/A')
+                    remaining[i] -= 1
+                    if results[i] is None:
+                        continue
+                    
+                    try:
+                        results[i][name] = future.result()
+                    except Exception as e:
+                        log.error(f"❌ Error processing {app_id}: {e}\n")
+                        self.skipped_apps.append(app_id)
+                        results[i] = None
+                        continue
+                    
+                    if name == 'qapps' and not include_empty:
+                        if not results[i]['qapps']:
+                            log.info(f"⏭️  Skipping {app.get('displayName', app_id)}: no Q Apps\n")
+                            results[i] = None
+                            continue
+                        for other_name, call in calls.items():
+                            submit(i, other_name, call)
+                    
+                    # Data sources are listed per index once the indices are known
+                    if name == 'index_ids':
+                        for index_id in results[i]['index_ids']:
+                            submit(i, ('data_sources', index_id), self.get_data_sources, index_id)
+                    
+                    if not remaining[i]:
+                        app_results = results[i]
+                        results[i] = None
+                        application = {
+                            'app': app,
+                            'index_ids': app_results['index_ids'],
+                            'qapps': app_results['qapps'],
+                            'data_sources': [
+                                source for index_id in app_results['index_ids']
+                                for source in app_results[('data_sources', index_id)]
+                            ],
+                            'retrievers': app_results['retrievers'],
+                            'plugins': app_results['plugins'],
+                            'chat_controls': app_results['chat_controls'],
+                        }
+                        self._log_application(application)
+                        yield application
+    
+    def _log_application(self, application):
+        """Report what was found for one application"""
+        app = application['app']
+        app_id = app.get('applicationId', 'N/A')
+        lines = [f"📊 Processing: {app.get('displayName', app_id)}"]
+        lines.append(f"   📱 Found {len(application['qapps'])} Q App(s)")
+        if application['index_ids']:
+            lines.append(f"   📁 Found {len(application['data_sources'])} data source(s)")
+        lines.append(f"   🔍 Found {len(application['retrievers'])} retriever(s)")
+        lines.append(f"   🔌 Found {len(application['plugins'])} plugin(s)")
+        lines.append(f"   💬 Chat controls retrieved")
+        lines.append("")
+        log.info("\n".join(lines))
+    
+    def _build_application_rows(self, application):
+        """Build the wide export rows of one application (one per Q App, or one if it has none)"""
+        # Application columns are the same for every Q App row
+        app_fields = self._create_app_fields(
+            application['app'], application['data_sources'], application['retrievers'],
+            application['plugins'], application['index_ids'], application['chat_controls']
+        )
+        row_template = _ROW_TEMPLATE.copy()
+        row_template.update(app_fields)
+        return [self._create_global_row(qapp, row_template) for qapp in application['qapps'] or [None]]
+    
+    def _build_normalized_rows(self, application):
+        """Build the rows of every normalized table for one application"""
+        app_fields = self._create_app_fields(
+            application['app'], application['data_sources'], application['retrievers'],
+            application['plugins'], application['index_ids'], application['chat_controls']
+        )
+        app_id = app_fields['app_id']
+        chat_controls = application['chat_controls'] or {}
+        row_template = _ROW_TEMPLATE.copy()
+        row_template.update(app_fields)
         
-        return all_data
+        return {
+            'applications': [_project_application(app_fields)],
+            'qapps': [_project_qapp(self._create_global_row(qapp, row_template)) for qapp in application['qapps']],
+            'indices': [(app_id, index_id) for index_id in application['index_ids']],
+            'data_sources': [
+                (app_id, source.get('dataSourceId', 'N/A'), source.get('type', 'N/A'),
+                 source.get('displayName', 'N/A'), source.get('status', 'N/A'))
+                for source in application['data_sources']
+            ],
+            'retrievers': [
+                (app_id, retriever.get('retrieverId', 'N/A'), retriever.get('type', 'N/A'),
+                 retriever.get('status', 'N/A'))
+                for retriever in application['retrievers']
+            ],
+            'plugins': [
+                (app_id, plugin.get('pluginId', 'N/A'), plugin.get('type', 'N/A'), plugin.get('status', 'N/A'))
+                for plugin in application['plugins']
+            ],
+            'topics': [
+                (app_id, topic.get('name', 'N/A'), topic.get('description', 'N/A'))
+                for topic in chat_controls.get('topicConfigurations', [])
+            ],
+            'blocked_phrases': [
+                (app_id, phrase) for phrase in chat_controls.get('blockedPhrases', {}).get('blockedPhrases', [])
+            ],
+        }
     
-    def _create_global_row(self, app, qapp, data_sources, retrievers, plugins, index_id, chat_controls):
-        """Create comprehensive data row"""
+    def _create_global_row(self, qapp, row_template):
+        """Create comprehensive data row from the application's prefilled row template"""
+        has_qapp = bool(qapp)
+        qapp = qapp or {}
+        
+        # Copying the template keeps the column order and never resizes the dict
+        row = row_template.copy()
+        
+        # ===== Q APP INFORMATION (Primary) =====
+        row['qapp_name'] = qapp.get('title', qapp.get('libraryItemId', 'No Q Apps'))
+        row['qapp_id'] = qapp.get('appId', 'N/A')
+        row['qapp_library_item_id'] = qapp.get('libraryItemId', 'N/A')
+        row['qapp_version'] = qapp.get('appVersion', 'N/A')
+        row['qapp_status'] = qapp.get('status', 'N/A')
+        row['qapp_user_count'] = qapp.get('userCount', 0)
+        row['qapp_owner_created_by'] = qapp.get('createdBy', 'N/A')
+        row['qapp_created_at'] = str(qapp.get('createdAt', 'N/A'))
+        row['qapp_updated_by'] = qapp.get('updatedBy', 'N/A')
+        row['qapp_updated_at'] = str(qapp.get('updatedAt', 'N/A'))
+        row['qapp_rating_count'] = qapp.get('ratingCount', 0)
+        row['qapp_is_verified'] = qapp.get('isVerified', False)
+        row['qapp_is_rated_by_user'] = qapp.get('isRatedByUser', False)
+        row['qapp_description'] = qapp.get('description', 'N/A')
+        row['qapp_categories'] = _joinget(qapp.get('categories', []), 'title', '') if has_qapp else 'N/A'
+        
+        return row
+    
+    def _create_app_fields(self, app, data_sources, retrievers, plugins, index_ids, chat_controls):
+        """Create the application columns shared by all of an application's rows"""
         
         # Extract app configurations
         attachments = app.get('attachmentsConfiguration', {})
@@ -356,30 +767,19 @@ class QBusinessGlobalExporter:
         quicksight_config = app.get('quickSightConfiguration', {})
         
         # Extract chat controls
-        blocked_phrases_config = chat_controls.get('blockedPhrases', {}) if chat_controls else {}
-        creator_mode = chat_controls.get('creatorModeConfiguration', {}) if chat_controls else {}
-        hallucination_reduction = chat_controls.get('hallucinationReductionConfiguration', {}) if chat_controls else {}
-        orchestration = chat_controls.get('orchestrationConfiguration', {}) if chat_controls else {}
-        topic_configs = chat_controls.get('topicConfigurations', []) if chat_controls else []
-        
-        row = {
-            # ===== Q APP INFORMATION (Primary) =====
-            'qapp_name': qapp.get('title', qapp.get('libraryItemId', 'No Q Apps')) if qapp else 'No Q Apps',
-            'qapp_id': qapp.get('appId', 'N/A') if qapp else 'N/A',
-            'qapp_library_item_id': qapp.get('libraryItemId', 'N/A') if qapp else 'N/A',
-            'qapp_version': qapp.get('appVersion', 'N/A') if qapp else 'N/A',
-            'qapp_status': qapp.get('status', 'N/A') if qapp else 'N/A',
-            'qapp_user_count': qapp.get('userCount', 0) if qapp else 0,
-            'qapp_owner_created_by': qapp.get('createdBy', 'N/A') if qapp else 'N/A',
-            'qapp_created_at': str(qapp.get('createdAt', 'N/A')) if qapp else 'N/A',
-            'qapp_updated_by': qapp.get('updatedBy', 'N/A') if qapp else 'N/A',
-            'qapp_updated_at': str(qapp.get('updatedAt', 'N/A')) if qapp else 'N/A',
-            'qapp_rating_count': qapp.get('ratingCount', 0) if qapp else 0,
-            'qapp_is_verified': qapp.get('isVerified', False) if qapp else False,
-            'qapp_is_rated_by_user': qapp.get('isRatedByUser', False) if qapp else False,
-            'qapp_description': qapp.get('description', 'N/A') if qapp else 'N/A',
-            'qapp_categories': ', '.join([cat.get('title', '') for cat in qapp.get('categories', [])]) if qapp else 'N/A',
-            
+        chat_controls = chat_controls or {}
+        blocked_phrases_config = chat_controls.get('blockedPhrases', {})
+        creator_mode = chat_controls.get('creatorModeConfiguration', {})
+        hallucination_reduction = chat_controls.get('hallucinationReductionConfiguration', {})
+        orchestration = chat_controls.get('orchestrationConfiguration', {})
+        topic_configs = chat_controls.get('topicConfigurations', [])
+        
+        # Join list attributes once per collection
+        ds = _collect(data_sources, 'dataSourceId', 'type', 'displayName', 'status')
+        ret = _collect(retrievers, 'retrieverId', 'type', 'status')
+        plg = _collect(plugins, 'pluginId', 'type', 'status')
+        
+        return {
             # ===== APPLICATION BASIC INFO =====
             'app_name': app.get('displayName', 'N/A'),
             'app_id': app.get('applicationId', 'N/A'),
@@ -414,11 +814,11 @@ class QBusinessGlobalExporter:
             'creator_mode_control': creator_mode.get('creatorModeControl', 'N/A'),
             'hallucination_reduction_control': hallucination_reduction.get('hallucinationReductionControl', 'N/A'),
             'orchestration_control': orchestration.get('control', 'N/A'),
-            'response_scope': chat_controls.get('responseScope', 'N/A') if chat_controls else 'N/A',
+            'response_scope': chat_controls.get('responseScope', 'N/A'),
             
             # ===== CHAT CONTROLS - TOPICS =====
             'topic_count': len(topic_configs),
-            'topic_names': ', '.join([t.get('name', 'N/A') for t in topic_configs]),
+            'topic_names': _joinget(topic_configs, 'name'),
             'topic_descriptions': ' | '.join([f"{t.get('name', 'N/A')}: {t.get('description', 'N/A')}" for t in topic_configs]),
             
             # ===== ERROR DETAILS =====
@@ -426,39 +826,207 @@ class QBusinessGlobalExporter:
             'error_message': app.get('error', {}).get('errorMessage', 'N/A'),
             
             # ===== INDEX =====
-            'index_id': index_id or 'N/A',
+            'index_id': index_ids[0] if index_ids else 'N/A',
+            'index_ids': ', '.join(index_ids) or 'N/A',
             
             # ===== DATA SOURCES =====
             'data_source_count': len(data_sources),
-            'data_source_ids': ', '.join([ds.get('dataSourceId', 'N/A') for ds in data_sources]),
-            'data_source_types': ', '.join([ds.get('type', 'N/A') for ds in data_sources]),
-            'data_source_names': ', '.join([ds.get('displayName', 'N/A') for ds in data_sources]),
-            'data_source_statuses': ', '.join([ds.get('status', 'N/A') for ds in data_sources]),
+            'data_source_ids': ds['dataSourceId'],
+            'data_source_types': ds['type'],
+            'data_source_names': ds['displayName'],
+            'data_source_statuses': ds['status'],
             
             # ===== RETRIEVERS =====
             'retriever_count': len(retrievers),
-            'retriever_ids': ', '.join([r.get('retrieverId', 'N/A') for r in retrievers]),
-            'retriever_types': ', '.join([r.get('type', 'N/A') for r in retrievers]),
-            'retriever_statuses': ', '.join([r.get('status', 'N/A') for r in retrievers]),
+            'retriever_ids': ret['retrieverId'],
+            'retriever_types': ret['type'],
+            'retriever_statuses': ret['status'],
             
             # ===== PLUGINS =====
             'plugin_count': len(plugins),
-            'plugin_ids': ', '.join([p.get('pluginId', 'N/A') for p in plugins]),
-            'plugin_types': ', '.join([p.get('type', 'N/A') for p in plugins]),
-            'plugin_statuses': ', '.join([p.get('status', 'N/A') for p in plugins]),
+            'plugin_ids': plg['pluginId'],
+            'plugin_types': plg['type'],
+            'plugin_statuses': plg['status'],
             
             # ===== METADATA =====
-            'export_timestamp': datetime.now().isoformat(),
+            'export_timestamp': self._export_ts,
             'aws_region': self.aws_region,
             'aws_account': self.expected_account or 'N/A',
         }
+    
+    def export_rows(self, rows, basename=None, pretty=False):
+        """Stream rows to CSV and NDJSON (or an indented JSON array if pretty) and return summary counts"""
+        summary = {'rows': 0, 'app_ids': set(), 'qapps': 0, 'write_failed': False}
         
-        return row
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return summary
+        
+        output_dir = Path('output')
+        output_dir.mkdir(exist_ok=True)
+        
+        if not basename:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            basename = f"qbusiness_global_{timestamp}"
+        
+        csv_path = output_dir / f"{basename}.csv"
+        json_path = output_dir / f"{basename}.json" if pretty else output_dir / f"{basename}.ndjson"
+        
+        # Only the formats enabled in the config are written
+        formats = self.config.get('export', {}).get('formats', {})
+        write_csv = formats.get('csv', True)
+        write_json = formats.get('json', True)
+        
+        try:
+            with ExitStack() as stack:
+                if write_csv:
+                    csv_file = stack.enter_context(
+                        open(csv_path, 'w', newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+                    )
+                    writer = csv.writer(csv_file)
+                    writer.writerow(FIELDNAMES)
+                if write_json:
+                    json_file = stack.enter_context(
+                        open(json_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+                    )
+                    if pretty:
+                        json_file.write('[')
+                
+                previous_app_id = first['app_id']
+                for row in itertools.chain([first], rows):
+                    # Flush once per finished application rather than per row
+                    if write_csv and row['app_id'] != previous_app_id:
+                        csv_file.flush()
+                    previous_app_id = row['app_id']
+                    
+                    if write_csv:
+                        writer.writerow(_project_row(row))
+                    
+                    if write_json and pretty:
+                        # Same layout as json.dump(data, indent=2), one element at a time
+                        json_file.write(',\n' if summary['rows'] else '\n')
+                        json_file.write(textwrap.indent(_to_json(row), '  '))
+                    elif write_json:
+                        json_file.write(_to_json_line(row))
+                        json_file.write('\n')
+                    
+                    summary['rows'] += 1
+                    summary['app_ids'].add(row['app_id'])
+                    if row['qapp_id'] != 'N/A':
+                        summary['qapps'] += 1
+                
+                if write_json and pretty:
+                    json_file.write('\n]')
+            
+            if write_csv:
+                log.info(f"\n✅ CSV exported to: {csv_path}")
+                log.info(f"   Total rows: {summary['rows']}")
+                log.info(f"   Total columns: {len(FIELDNAMES)}")
+            if write_json:
+                log.info(f"✅ {'JSON' if pretty else 'NDJSON'} exported to: {json_path}")
+            
+        except OSError as e:
+            # Only file errors are handled here; AWS errors raised by the row generator propagate
+            log.error(f"❌ Error writing export files: {e}")
+            summary['write_failed'] = True
+        
+        return summary
+    
+    def export_normalized(self, applications, basename=None, pretty=False):
+        """Stream applications to one CSV per normalized table and to NDJSON (or a JSON array if pretty)
+        
+        Returns the same summary counts as export_rows, with rows counted across all tables.
+        """
+        summary = {'rows': 0, 'app_ids': set(), 'qapps': 0, 'write_failed': False}
+        
+        applications = iter(applications)
+        first = next(applications, None)
+        if first is None:
+            return summary
+        
+        output_dir = Path('output')
+        output_dir.mkdir(exist_ok=True)
+        
+        if not basename:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            basename = f"qbusiness_global_{timestamp}"
+        
+        json_path = output_dir / f"{basename}.json" if pretty else output_dir / f"{basename}.ndjson"
+        
+        # Only the formats enabled in the config are written
+        formats = self.config.get('export', {}).get('formats', {})
+        write_csv = formats.get('csv', True)
+        write_json = formats.get('json', True)
+        
+        try:
+            with ExitStack() as stack:
+                csv_files = {}
+                writers = {}
+                if write_csv:
+                    for table, fields in NORMALIZED_TABLES.items():
+                        csv_files[table] = stack.enter_context(
+                            open(output_dir / f"{basename}_{table}.csv", 'w', newline='', encoding='utf-8',
+                                 buffering=OUTPUT_BUFFER_SIZE)
+                        )
+                        writers[table] = csv.writer(csv_files[table])
+                        writers[table].writerow(fields)
+                if write_json:
+                    json_file = stack.enter_context(
+                        open(json_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+                    )
+                    if pretty:
+                        json_file.write('[')
+                
+                for count, application in enumerate(itertools.chain([first], applications)):
+                    tables = self._build_normalized_rows(application)
+                    
+                    if write_csv:
+                        # Flush once per finished application, and only the tables it wrote to
+                        for table, rows in tables.items():
+                            if rows:
+                                writers[table].writerows(rows)
+                                csv_files[table].flush()
+                    
+                    if write_json:
+                        # One document per application, with its rows grouped by table
+                        document = {
+                            table: [dict(zip(NORMALIZED_TABLES[table], row)) for row in rows]
+                            for table, rows in tables.items()
+                        }
+                        if pretty:
+                            json_file.write(',\n' if count else '\n')
+                            json_file.write(textwrap.indent(_to_json(document), '  '))
+                        else:
+                            json_file.write(_to_json_line(document))
+                            json_file.write('\n')
+                    
+                    summary['rows'] += sum(len(rows) for rows in tables.values())
+                    summary['app_ids'].add(application['app'].get('applicationId', 'N/A'))
+                    summary['qapps'] += len(tables['qapps'])
+                
+                if write_json and pretty:
+                    json_file.write('\n]')
+            
+            if write_csv:
+                log.info(f"\n✅ CSV tables exported to: {output_dir / basename}_<table>.csv")
+                for table in NORMALIZED_TABLES:
+                    log.info(f"   {table}")
+                log.info(f"   Total rows: {summary['rows']}")
+            if write_json:
+                log.info(f"✅ {'JSON' if pretty else 'NDJSON'} exported to: {json_path}")
+            
+        except OSError as e:
+            # Only file errors are handled here; AWS errors raised by the row generator propagate
+            log.error(f"❌ Error writing export files: {e}")
+            summary['write_failed'] = True
+        
+        return summary
     
     def export_to_csv(self, data, filename=None):
         """Export to CSV"""
         if not data:
-            print("⚠️  No data to export")
+            log.warning("⚠️  No data to export")
             return
         
         output_dir = Path('output')
@@ -471,19 +1039,17 @@ class QBusinessGlobalExporter:
         output_path = output_dir / filename
         
         try:
-            fieldnames = list(data[0].keys())
-            
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(FIELDNAMES)
+                writer.writerows(map(_project_row, data))
             
-            print(f"\n✅ CSV exported to: {output_path}")
-            print(f"   Total rows: {len(data)}")
-            print(f"   Total columns: {len(fieldnames)}")
+            log.info(f"\n✅ CSV exported to: {output_path}")
+            log.info(f"   Total rows: {len(data)}")
+            log.info(f"   Total columns: {len(FIELDNAMES)}")
             
         except Exception as e:
-            print(f"❌ Error exporting CSV: {e}")
+            log.error(f"❌ Error exporting CSV: {e}")
     
     def export_to_json(self, data, filename=None):
         """Export to JSON"""
@@ -500,13 +1066,373 @@ class QBusinessGlobalExporter:
         output_path = output_dir / filename
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            if orjson is not None:
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC, default=str))
+            else:
+                with open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+                    json.dump(data, f, indent=2, default=str)
             
-            print(f"✅ JSON exported to: {output_path}")
+            log.info(f"✅ JSON exported to: {output_path}")
             
         except Exception as e:
-            print(f"❌ Error exporting JSON: {e}")
+            log.error(f"❌ Error exporting JSON: {e}")
+
+
+class AsyncQBusinessGlobalExporter(QBusinessGlobalExporter):
+    """Asynchronous variant of the global exporter built on aioboto3
+    
+    A single qbusiness and qapps client is opened for the whole export and shared
+    by every coroutine; an asyncio.Semaphore bounds the number of in-flight calls.
+    """
+    
+    def __init__(self, config_path='./input/config.yml', env_path='./config/.env'):
+        """Initialize the exporter with configuration"""
+        if aioboto3 is None:
+            raise ImportError("aioboto3 is required for AsyncQBusinessGlobalExporter")
+        super().__init__(config_path, env_path)
+        
+        session_params = {'region_name': self.aws_region}
+        if self.aws_profile:
+            session_params['profile_name'] = self.aws_profile
+        self.async_session = aioboto3.Session(**session_params)
+        self.concurrency = self.config.get('retrieval', {}).get('async_concurrency', 32)
+        
+        self._exit_stack = None
+        self._semaphore = None
+        self._qbusiness = None
+        self._qapps = None
+    
+    def _create_sync_clients(self):
+        """Skip the boto3 service clients and the describe pool; __aenter__ opens async clients instead"""
+        self.qbusiness_client = None
+        self.qapps_client = None
+        self._detail_pool = None
+    
+    async def __aenter__(self):
+        """Open the shared async clients"""
+        self._exit_stack = AsyncExitStack()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._qbusiness = await self._exit_stack.enter_async_context(
+            self.async_session.client('qbusiness', config=self._client_config)
+        )
+        self._qapps = await self._exit_stack.enter_async_context(
+            self.async_session.client('qapps', config=self._client_config)
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared async clients"""
+        await self._exit_stack.aclose()
+        self._exit_stack = None
+    
+    async def _call(self, method, **params):
+        """Issue one API call, bounded by the concurrency semaphore"""
+        async with self._semaphore:
+            return await method(**params)
+    
+    async def _paginate(self, client, operation, page_size, size_param='maxResults', **params):
+        """Yield result pages of a list operation, using the aiobotocore paginator when available"""
+        if client.can_paginate(operation):
+            paginator = client.get_paginator(operation)
+            pages = paginator.paginate(PaginationConfig={'PageSize': page_size}, **params).__aiter__()
+            while True:
+                # Each page is one API call, so it counts against the concurrency limit too
+                async with self._semaphore:
+                    try:
+                        page = await pages.__anext__()
+                    except StopAsyncIteration:
+                        return
+                yield page
+        
+        # Fall back to a manual nextToken loop
+        method = getattr(client, operation)
+        params[size_param] = page_size
+        while True:
+            response = await self._call(method, **params)
+            yield response
+            next_token = response.get('nextToken')
+            if not next_token:
+                break
+            params['nextToken'] = next_token
+    
+    async def _fetch_details(self, items, fetch_detail, cache_type, id_key):
+        """Run fetch_detail over one page of list results concurrently, preserving order"""
+        async def cached_fetch(item):
+            detail = self._read_describe_cache(cache_type, item.get(id_key), item.get('updatedAt'))
+            if detail is not None:
+                return {**detail, **item}
+            detail = await fetch_detail(item)
+            if detail is not None and detail is not item:
+                self._write_describe_cache(cache_type, item.get(id_key), item.get('updatedAt'), detail)
+            return detail
+        
+        return list(await asyncio.gather(*(cached_fetch(item) for item in items)))
+    
+    async def list_applications(self):
+        """Get all Q Business applications with details"""
+        try:
+            log.info("🔍 Retrieving Q Business applications...\n")
+            self._purge_describe_cache()
+            
+            applications = []
+            
+            async def fetch_detail(app):
+                try:
+                    return await self._call(
+                        self._qbusiness.get_application,
+                        applicationId=app['applicationId']
+                    )
+                except ClientError as e:
+                    # A throttled describe drops only this application, never the whole listing
+                    if _is_throttled(e):
+                        log.error(f"❌ Skipping {app['applicationId']}: {e}\n")
+                        self.skipped_apps.append(app['applicationId'])
+                        return None
+                    log.warning(f"⚠️  Could not get details for {app['applicationId']}: {e}")
+                    return app
+            
+            async for page in self._paginate(self._qbusiness, 'list_applications', 100):
+                apps = page.get('applications', [])
+                details = await self._fetch_details(apps, fetch_detail, 'applications', 'applicationId')
+                applications.extend(detail for detail in details if detail is not None)
+            
+            log.info(f"✅ Found {len(applications)} Q Business application(s)\n")
+            return applications
+        except ClientError as e:
+            log.error(f"❌ Error listing applications: {e}")
+            return []
+    
+    async def get_qapps(self, application_id):
+        """Get Q Apps for an application"""
+        try:
+            qapps = []
+            
+            # Library item summaries already carry every field get_library_item returns
+            async for page in self._paginate(self._qapps, 'list_library_items', 100,
+                                             size_param='limit', instanceId=application_id):
+                qapps.extend(page.get('libraryItems', []))
+            
+            return qapps
+        except ClientError as e:
+            _raise_if_throttled(e)
+            return []
+    
+    async def get_index_ids(self, application_id):
+        """Get the IDs of all indices for an application"""
+        try:
+            index_ids = []
+            async for page in self._paginate(self._qbusiness, 'list_indices', 100,
+                                             applicationId=application_id):
+                index_ids.extend(index['indexId'] for index in page.get('indices', []))
+            return index_ids
+        except ClientError as e:
+            _raise_if_throttled(e)
+            return []
+    
+    async def get_data_sources(self, application_id, index_id, fetch_details=False):
+        """Get data sources (list summaries unless fetch_details is set)"""
+        try:
+            data_sources = []
+            
+            async def fetch_detail(source):
+                try:
+                    return await self._call(
+                        self._qbusiness.get_data_source,
+                        applicationId=application_id,
+                        indexId=index_id,
+                        dataSourceId=source['dataSourceId']
+                    )
+                except ClientError as e:
+                    _raise_if_throttled(e)
+                    return source
+            
+            # list_data_sources accepts at most 10 results per page
+            async for page in self._paginate(self._qbusiness, 'list_data_sources', 10,
+                                             applicationId=application_id, indexId=index_id):
+                sources = page.get('dataSources', [])
+                if fetch_details:
+                    sources = await self._fetch_details(sources, fetch_detail, 'data_sources', 'dataSourceId')
+                data_sources.extend(sources)
+            
+            return data_sources
+        except ClientError as e:
+            _raise_if_throttled(e)
+            return []
+    
+    async def get_retrievers(self, application_id, fetch_details=False):
+        """Get retrievers (list summaries unless fetch_details is set)"""
+        try:
+            retrievers = []
+            
+            async def fetch_detail(retriever):
+                try:
+                    return await self._call(
+                        self._qbusiness.get_retriever,
+                        applicationId=application_id,
+                        retrieverId=retriever['retrieverId']
+                    )
+                except ClientError as e:
+                    _raise_if_throttled(e)
+                    return retriever
+            
+            async for page in self._paginate(self._qbusiness, 'list_retrievers', 50,
+                                             applicationId=application_id):
+                ret_list = page.get('retrievers', [])
+                if fetch_details:
+                    ret_list = await self._fetch_details(ret_list, fetch_detail, 'retrievers', 'retrieverId')
+                retrievers.extend(ret_list)
+            
+            return retrievers
+        except ClientError as e:
+            _raise_if_throttled(e)
+            return []
+    
+    async def get_plugins(self, application_id, fetch_details=False):
+        """Get plugins (list summaries unless fetch_details is set)"""
+        try:
+            plugins = []
+            
+            async def fetch_detail(plugin):
+                try:
+                    return await self._call(
+                        self._qbusiness.get_plugin,
+                        applicationId=application_id,
+                        pluginId=plugin['pluginId']
+                    )
+                except ClientError as e:
+                    _raise_if_throttled(e)
+                    return plugin
+            
+            async for page in self._paginate(self._qbusiness, 'list_plugins', 50,
+                                             applicationId=application_id):
+                plugin_list = page.get('plugins', [])
+                if fetch_details:
+                    plugin_list = await self._fetch_details(plugin_list, fetch_detail, 'plugins', 'pluginId')
+                plugins.extend(plugin_list)
+            
+            return plugins
+        except ClientError as e:
+            _raise_if_throttled(e)
+            return []
+    
+    async def get_chat_controls(self, application_id):
+        """Get chat controls configuration, including every page of topic configurations"""
+        try:
+            chat_controls = {}
+            topic_configs = []
+            async for page in self._paginate(self._qbusiness, 'get_chat_controls_configuration', 50,
+                                             applicationId=application_id):
+                chat_controls = chat_controls or page
+                topic_configs.extend(page.get('topicConfigurations', []))
+            if chat_controls:
+                chat_controls['topicConfigurations'] = topic_configs
+            return chat_controls
+        except ClientError as e:
+            _raise_if_throttled(e)
+            return {}
+    
+    def export_all_data(self):
+        """Export complete Q Business data on a new event loop"""
+        return asyncio.run(self.export_all_data_async())
+    
+    def iter_applications(self):
+        """Yield the retrieved data of each application once the asynchronous export has completed"""
+        yield from asyncio.run(self.export_applications_async())
+    
+    async def export_all_data_async(self):
+        """Export complete Q Business data including Q Apps and configurations"""
+        all_data = []
+        for application in await self.export_applications_async():
+            all_data.extend(self._build_application_rows(application))
+        return all_data
+    
+    async def export_applications_async(self):
+        """Retrieve the data of every application"""
+        include_empty = self.config.get('export', {}).get('include_empty_apps', True)
+        self._export_ts = datetime.now().isoformat()
+        self.skipped_apps = []
+        
+        async with self:
+            applications = await self.list_applications()
+            results = await asyncio.gather(
+                *(self._process_application(app, include_empty) for app in applications),
+                return_exceptions=True
+            )
+        
+        exported = []
+        for app, application in zip(applications, results):
+            if isinstance(application, Exception):
+                log.error(f"❌ Error processing {app.get('applicationId', 'N/A')}: {application}\n")
+                self.skipped_apps.append(app.get('applicationId', 'N/A'))
+                continue
+            if application is None:
+                log.info(f"⏭️  Skipping {app.get('displayName', app.get('applicationId', 'N/A'))}: no Q Apps\n")
+                continue
+            self._log_application(application)
+            exported.append(application)
+        
+        return exported
+    
+    async def _process_application(self, app, include_empty):
+        """Retrieve Q Apps and configurations for one application (None if skipped for having no Q Apps)"""
+        app_id = app.get('applicationId', 'N/A')
+        
+        # Without include_empty, the other calls wait until the application is known to have Q Apps
+        if include_empty:
+            qapps_call = self.get_qapps(app_id)
+        else:
+            qapps = await self.get_qapps(app_id)
+            if not qapps:
+                return None
+            qapps_call = asyncio.sleep(0, result=qapps)
+        
+        async def get_index_data_sources():
+            index_ids = await self.get_index_ids(app_id)
+            per_index_sources = await asyncio.gather(
+                *(self.get_data_sources(app_id, index_id) for index_id in index_ids)
+            )
+            return index_ids, [source for sources in per_index_sources for source in sources]
+        
+        # Indices (then their data sources), Q Apps, retrievers, plugins and chat controls are independent
+        (index_ids, data_sources), qapps, retrievers, plugins, chat_controls = await asyncio.gather(
+            get_index_data_sources(),
+            qapps_call,
+            self.get_retrievers(app_id),
+            self.get_plugins(app_id),
+            self.get_chat_controls(app_id)
+        )
+        
+        return {
+            'app': app,
+            'index_ids': index_ids,
+            'qapps': qapps,
+            'data_sources': data_sources,
+            'retrievers': retrievers,
+            'plugins': plugins,
+            'chat_controls': chat_controls,
+        }
+
+
+def _run_export(config_path, env_path, use_async=False):
+    """Run a complete export in the current process and return the rows"""
+    if use_async and aioboto3 is not None:
+        exporter = AsyncQBusinessGlobalExporter(config_path, env_path)
+    else:
+        exporter = QBusinessGlobalExporter(config_path, env_path)
+    return exporter.export_all_data()
+
+
+def export_all_data_in_subprocess(config_path='./input/config.yml', env_path='./config/.env', use_async=False):
+    """Run the export in a child process and return the rows
+    
+    Intended for callers that embed the exporter in a process which already runs
+    its own asyncio event loop (web handlers, notebooks). The child is spawned rather
+    than forked, since forking a host that runs threads or an event loop is unsafe; it
+    builds its own session, clients and event loop, and rows come back as plain dicts via pickle.
+    """
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(_run_export, config_path, env_path, use_async).result()
 
 
 def main():
@@ -516,54 +1442,86 @@ def main():
     )
     parser.add_argument('--config', default='./input/config.yml', help='Path to config YAML')
     parser.add_argument('--env', default='./config/.env', help='Path to .env file')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Use the aioboto3 asynchronous exporter (falls back to threads if not installed)')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Write an indented JSON array instead of newline-delimited JSON')
+    parser.add_argument('--denormalized', action='store_true',
+                        help='Write one wide row per Q App instead of a CSV per table')
     
     args = parser.parse_args()
     
+    listener = _configure_logging()
+    try:
+        exit_code = _run_cli(args)
+    finally:
+        listener.stop()
+    sys.exit(exit_code)
+
+
+def _run_cli(args):
+    """Run the export for parsed command-line arguments and return the process exit code"""
     # Header
-    print("=" * 100)
-    print("Q BUSINESS GLOBAL EXPORT TOOL - Complete Application & Q Apps Information")
-    print("=" * 100)
-    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Config: {args.config}")
-    print(f"Credentials: {args.env}")
-    print("=" * 100)
-    print()
+    log.info("=" * 100)
+    log.info("Q BUSINESS GLOBAL EXPORT TOOL - Complete Application & Q Apps Information")
+    log.info("=" * 100)
+    log.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    log.info(f"Config: {args.config}")
+    log.info(f"Credentials: {args.env}")
+    log.info("=" * 100)
+    log.info("")
     
     # Initialize
-    print("🔧 Initializing...")
-    exporter = QBusinessGlobalExporter(args.config, args.env)
+    log.info("🔧 Initializing...")
+    if args.use_async and aioboto3 is None:
+        log.warning("⚠️  aioboto3 is not installed; using the threaded exporter")
+    if args.use_async and aioboto3 is not None:
+        exporter = AsyncQBusinessGlobalExporter(args.config, args.env)
+    else:
+        exporter = QBusinessGlobalExporter(args.config, args.env)
     
     # Verify credentials
     if not exporter.verify_credentials():
-        print("❌ Exiting due to credential issues")
-        return
-    
-    print("🚀 Starting global data export...\n")
-    
-    # Export all data
-    data = exporter.export_all_data()
-    
-    if data:
-        print("=" * 100)
-        print("📊 EXPORTING DATA")
-        print("=" * 100)
-        print()
-        
-        # Export
-        exporter.export_to_csv(data)
-        exporter.export_to_json(data)
-        
-        print("\n" + "=" * 100)
-        print("📈 SUMMARY")
-        print("=" * 100)
-        print(f"   Total Records: {len(data)}")
-        print(f"   Q Business Applications: {len(set([d['app_id'] for d in data]))}")
-        print(f"   Q Apps Found: {sum(1 for d in data if d['qapp_id'] != 'N/A')}")
-        print(f"   Output Directory: ./output/")
-        print("=" * 100)
-        print("\n✅ Done!")
+        log.error("❌ Exiting due to credential issues")
+        return 1
+    
+    log.info("🚀 Starting global data export...\n")
+    
+    # Export all data, writing rows to disk as each application completes
+    try:
+        if args.denormalized:
+            summary = exporter.export_rows(exporter.iter_rows(), pretty=args.pretty)
+        else:
+            summary = exporter.export_normalized(exporter.iter_applications(), pretty=args.pretty)
+    except (BotoCoreError, ClientError) as e:
+        # Rows are fetched while the files are written, so the output on disk is truncated
+        log.error(f"❌ Export failed, output files are incomplete: {e}")
+        return 1
+    
+    if summary['write_failed']:
+        return 1
+    
+    if summary['rows']:
+        log.info("\n" + "=" * 100)
+        log.info("📈 SUMMARY")
+        log.info("=" * 100)
+        log.info(f"   Total Records: {summary['rows']}")
+        log.info(f"   Q Business Applications: {len(summary['app_ids'])}")
+        log.info(f"   Q Apps Found: {summary['qapps']}")
+        log.info(f"   Skipped Applications: {len(exporter.skipped_apps)}")
+        log.info(f"   Output Directory: ./output/")
+        log.info("=" * 100)
     else:
-        print("⚠️  No data found to export")
+        log.warning("⚠️  No data found to export")
+    
+    if exporter.skipped_apps:
+        log.error(f"\n❌ Export incomplete: {len(exporter.skipped_apps)} application(s) skipped: "
+                  f"{', '.join(exporter.skipped_apps)}")
+        return 1
+    
+    if summary['rows']:
+        log.info("\n✅ Done!")
+    return 0
 
 
 if __name__ == "__main__":
@@ -13,7 +13,7 @@ New in Enhanced Version:
 - Maps user UUIDs to actual usernames and email addresses
 - Adds creator and updater details for each Q App
 - Uses IAM Identity Center (identitystore) API for user lookups
-- Caches user lookups to minimize API calls
+- Caches user lookups to minimize API calls (persisted in output/.cache/user_cache.sqlite beside this script)
 
 Features:
 - Complete Q Business application inventory
@@ -24,27 +24,173 @@ Features:
 
 Usage:
     python get_qbusiness_global_enhanced.py [--config path/to/config.yml] [--env path/to/.env]
+                                            [--cache-ttl SECONDS] [--async] [--jobs N]
 
 Date: January 12, 2026
 """
 
 import os
+import sys
 import csv
-import json
+import textwrap
+import time
+import asyncio
+import sqlite3
 import argparse
+import operator
+import threading
+import itertools
+from collections import Counter
+from contextlib import AsyncExitStack, ExitStack
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 import boto3
 import yaml
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 from dotenv import load_dotenv
 
+# Helpers, constants and the STS identity cache (file and expiry policy) are shared with the global exporter
+from get_qbusiness_global import (
+    CACHE_DIR, OUTPUT_BUFFER_SIZE, _collect, _is_throttled, _raise_if_throttled, _to_json,
+    get_cached_caller_identity
+)
+
+try:
+    import aioboto3
+except ImportError:  # Optional dependency, only needed for --async
+    aioboto3 = None
+
+
+# Identity Store user lookups, kept in the shared cache directory
+USER_CACHE_PATH = CACHE_DIR / 'user_cache.sqlite'
+USER_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Export columns, in order
+FIELDNAMES = (
+    # Q App information
+    'qapp_name', 'qapp_id', 'qapp_library_item_id', 'qapp_version', 'qapp_status',
+    'qapp_user_count',
+    # Q App creator and updater details
+    'qapp_creator_user_id', 'qapp_creator_username', 'qapp_creator_email',
+    'qapp_creator_display_name', 'qapp_created_at', 'qapp_updater_user_id',
+    'qapp_updater_username', 'qapp_updater_email', 'qapp_updated_at',
+    # Q App additional metadata
+    'qapp_rating_count', 'qapp_is_verified', 'qapp_is_rated_by_user', 'qapp_description',
+    'qapp_categories',
+    # Application basic info
+    'app_name', 'app_id', 'app_arn', 'app_description', 'app_status', 'app_created_at',
+    'app_updated_at',
+    # Identity & security
+    'identity_type', 'identity_center_arn', 'identity_store_id', 'iam_identity_provider_arn',
+    'client_ids_for_oidc', 'role_arn', 'encryption_kms_key',
+    # Application configuration
+    'attachments_mode', 'auto_subscribe', 'auto_subscribe_default', 'personalization_mode',
+    'qapps_mode', 'quicksight_namespace',
+    # Chat controls
+    'blocked_phrases_count', 'blocked_phrases', 'blocked_phrases_system_message',
+    'creator_mode_control', 'hallucination_reduction_control', 'orchestration_control',
+    'response_scope', 'topic_count', 'topic_names', 'topic_descriptions',
+    # Errors and index
+    'error_code', 'error_message', 'index_id',
+    # Data sources, retrievers and plugins
+    'data_source_count', 'data_source_ids', 'data_source_types', 'data_source_names',
+    'data_source_statuses', 'retriever_count', 'retriever_ids', 'retriever_types',
+    'retriever_statuses', 'plugin_count', 'plugin_ids', 'plugin_types', 'plugin_statuses',
+    # Metadata
+    'export_timestamp', 'aws_region', 'aws_account',
+)
+_project_row = operator.itemgetter(*FIELDNAMES)
+
+# Every export column, in order; copied and filled in per application
+_ROW_TEMPLATE = dict.fromkeys(FIELDNAMES)
+
+# Q App columns copied straight from the library item: (column, library item key, default)
+_QAPP_FIELD_MAP = (
+    ('qapp_id', 'appId', 'N/A'),
+    ('qapp_library_item_id', 'libraryItemId', 'N/A'),
+    ('qapp_version', 'appVersion', 'N/A'),
+    ('qapp_status', 'status', 'N/A'),
+    ('qapp_user_count', 'userCount', 0),
+    ('qapp_creator_user_id', 'createdBy', 'N/A'),
+    ('qapp_updater_user_id', 'updatedBy', 'N/A'),
+    ('qapp_rating_count', 'ratingCount', 0),
+    ('qapp_is_verified', 'isVerified', False),
+    ('qapp_is_rated_by_user', 'isRatedByUser', False),
+    ('qapp_description', 'description', 'N/A'),
+)
+
+
+def _qapp_user_ids(qapps):
+    """Return the creator and updater ids of the given Q Apps"""
+    return [qapp.get('createdBy', 'N/A') for qapp in qapps] + [qapp.get('updatedBy', 'N/A') for qapp in qapps]
+
+
+def _user_placeholder(user_id):
+    """Return the user details used when a user cannot be resolved"""
+    return {'username': user_id, 'email': 'N/A', 'display_name': 'N/A'}
+
+
+def _report_client_error(error, context):
+    """Re-raise throttling errors; report any other failed call (except a missing resource) with its error code"""
+    _raise_if_throttled(error)
+    code = error.response.get('Error', {}).get('Code', 'Unknown')
+    if code != 'ResourceNotFoundException':
+        print(f"⚠️  Skipping {context}: {code}")
+
+
+class _UserCacheStore:
+    """SQLite-backed store of Identity Store user lookups, kept between runs"""
+    
+    def __init__(self, path=USER_CACHE_PATH):
+        """Open (or create) the cache database"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit; callers serialize access through the exporter's user cache lock
+        self.connection = sqlite3.connect(str(path), isolation_level=None, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS users ('
+            'store_id TEXT, user_id TEXT, username TEXT, email TEXT, display_name TEXT, '
+            'fetched_at INTEGER, PRIMARY KEY (store_id, user_id))'
+        )
+    
+    def load(self, store_id, ttl):
+        """Return the users of an identity store fetched within the last ttl seconds"""
+        rows = self.connection.execute(
+            'SELECT user_id, username, email, display_name FROM users WHERE store_id = ? AND fetched_at >= ?',
+            (store_id, int(time.time()) - ttl)
+        )
+        return {
+            user_id: {'username': username, 'email': email, 'display_name': display_name}
+            for user_id, username, email, display_name in rows
+        }
+    
+    def save(self, store_id, users):
+        """Write user lookups ({user_id: user_info}) through to disk"""
+        fetched_at = int(time.time())
+        with self.connection:
+            # The connection autocommits, so an explicit BEGIN makes the batch one transaction
+            self.connection.execute('BEGIN')
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO users VALUES (?, ?, ?, ?, ?, ?)',
+                [
+                    (store_id, user_id, info['username'], info['email'], info['display_name'], fetched_at)
+                    for user_id, info in users.items()
+                ]
+            )
+    
+    def close(self):
+        """Close the cache database"""
+        self.connection.close()
+
 
 class QBusinessGlobalExporterEnhanced:
     """Export complete Q Business application information including Q Apps and configurations with user details"""
     
-    def __init__(self, config_path='./input/config.yml', env_path='./config/.env'):
+    def __init__(self, config_path='./input/config.yml', env_path='./config/.env', cache_ttl=USER_CACHE_TTL_SECONDS,
+                 jobs=None):
         """Initialize the exporter with configuration"""
         self.config = self._load_config(config_path)
         load_dotenv(env_path)
@@ -54,16 +200,46 @@ class QBusinessGlobalExporterEnhanced:
         self.aws_profile = self.config.get('aws', {}).get('profile') or os.getenv('AWS_PROFILE')
         self.expected_account = self.config.get('aws', {}).get('expected_account_id') or os.getenv('AWS_ACCOUNT_ID')
         
-        # Initialize boto3
+        # Initialize boto3 (clients are shared by all worker threads)
         self.session = self._create_session()
-        self.qbusiness_client = None
-        self.qapps_client = None
-        self.identitystore_client = None
-        self.sso_admin_client = None
+        self._client_config = self._create_client_config()
+        self.qbusiness_client = self.session.client('qbusiness', config=self._client_config)
+        self.qapps_client = self.session.client('qapps', config=self._client_config)
+        self.identitystore_client = self.session.client('identitystore', config=self._client_config)
+        self.sso_admin_client = self.session.client('sso-admin', config=self._client_config)
+        self.sts_client = self.session.client('sts', config=self._client_config)
+        
+        # Concurrency settings
+        self.max_workers = jobs or self.config.get('retrieval', {}).get('max_workers', 8)
+        self.detail_workers = self.config.get('retrieval', {}).get('detail_workers', 10)
+        
+        # List calls from every application share one pool, and describe calls another, so a
+        # list call waiting on its describes never holds a thread the describes need
+        # (threads start on first use)
+        self._call_pool = ThreadPoolExecutor(max_workers=self.max_workers * 5)
+        self._detail_pool = ThreadPoolExecutor(max_workers=self.detail_workers)
         
         # Cache for user lookups and identity store
         self.user_cache = {}
+        self._user_cache_lock = threading.Lock()
+        self._pending_users = {}
         self.identity_store_id = None
+        self.identity_store_prefetched = False
+        
+        # On-disk user cache shared between runs (disabled when the TTL is not positive)
+        self.cache_ttl = cache_ttl
+        self.user_cache_store = None
+        if cache_ttl > 0:
+            try:
+                self.user_cache_store = _UserCacheStore()
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️  User cache unavailable, continuing without it: {e}")
+        
+        # One timestamp per export run, shared by every row
+        self._export_ts = datetime.now().isoformat()
+        
+        # IDs of applications dropped from the export (throttled past the retries, or failed)
+        self.skipped_apps = []
         
         self.verbose = True
     
@@ -82,11 +258,33 @@ class QBusinessGlobalExporterEnhanced:
             session_params['profile_name'] = self.aws_profile
         return boto3.Session(**session_params)
     
+    def _create_client_config(self):
+        """Create botocore client configuration for concurrent API calls"""
+        retrieval = self.config.get('retrieval', {})
+        return Config(
+            max_pool_connections=retrieval.get('max_pool_connections', 32),
+            tcp_keepalive=True,
+            retries={
+                'max_attempts': retrieval.get('retry', {}).get('max_attempts', 10),
+                'mode': 'adaptive'
+            },
+            connect_timeout=5,
+            read_timeout=30
+        )
+    
+    def close(self):
+        """Release the worker pools and the user cache database"""
+        self._call_pool.shutdown()
+        self._detail_pool.shutdown()
+        if self.user_cache_store:
+            with self._user_cache_lock:
+                self.user_cache_store.close()
+                self.user_cache_store = None
+    
     def verify_credentials(self):
         """Verify AWS credentials"""
         try:
-            sts = self.session.client('sts')
-            identity = sts.get_caller_identity()
+            identity = self._get_caller_identity()
             
             print("✅ AWS Credentials Verified")
             print(f"   Account: {identity['Account']}")
@@ -97,12 +295,13 @@ class QBusinessGlobalExporterEnhanced:
             print(f"❌ Credential verification failed: {e}")
             return False
     
+    def _get_caller_identity(self):
+        """Get the STS caller identity, reusing a cached result while it is fresh"""
+        return get_cached_caller_identity(self.session, self.sts_client, self.aws_profile, self.aws_region)
+    
     def get_identity_store_id(self, identity_center_arn):
         """Extract Identity Store ID from Identity Center ARN"""
         try:
-            if not self.sso_admin_client:
-                self.sso_admin_client = self.session.client('sso-admin')
-            
             # List SSO instances to find the Identity Store ID
             response = self.sso_admin_client.list_instances()
             if response.get('Instances'):
@@ -122,49 +321,124 @@ class QBusinessGlobalExporterEnhanced:
     
     def get_user_details(self, identity_store_id, user_id):
         """Get user details from Identity Store"""
-        # Check cache first
-        if user_id in self.user_cache:
-            return self.user_cache[user_id]
-        
-        # Skip if no identity store or invalid user_id
-        if not identity_store_id or user_id == 'N/A':
-            user_info = {
-                'username': user_id,
-                'email': 'N/A',
-                'display_name': 'N/A'
-            }
-            self.user_cache[user_id] = user_info
+        # Rows without a Q App have no creator or updater, so there is nothing to look up
+        if user_id == 'N/A':
+            return _user_placeholder(user_id)
+        
+        # Cache hits take no lock: a single dict lookup is atomic and entries are never removed
+        user_info = self.user_cache.get(user_id)
+        if user_info is not None:
             return user_info
+        return self.resolve_users(identity_store_id, [user_id])[user_id]
+    
+    def resolve_users(self, identity_store_id, user_ids):
+        """Get details for several users, fetching each unknown user only once and concurrently"""
+        user_ids = set(user_ids)
+        
+        # Claim every user that is neither cached nor already being fetched by another worker
+        with self._user_cache_lock:
+            pending = {}
+            for user_id in user_ids - self.user_cache.keys():
+                if user_id not in self._pending_users:
+                    self._pending_users[user_id] = self._detail_pool.submit(
+                        self._fetch_user_details, identity_store_id, user_id
+                    )
+                pending[user_id] = self._pending_users[user_id]
+        
+        for user_id, future in pending.items():
+            try:
+                user_info = future.result()
+            except Exception:
+                # Let a later application retry the lookup
+                with self._user_cache_lock:
+                    self._pending_users.pop(user_id, None)
+                raise
+            with self._user_cache_lock:
+                self.user_cache[user_id] = user_info
+                self._pending_users.pop(user_id, None)
+        
+        with self._user_cache_lock:
+            return {user_id: self.user_cache[user_id] for user_id in user_ids}
+    
+    def _fetch_user_details(self, identity_store_id, user_id):
+        """Fetch one user from the Identity Store, returning a placeholder if it cannot be resolved"""
+        placeholder = _user_placeholder(user_id)
+        
+        # Skip if no identity store or invalid user_id, or if the prefetched
+        # directory does not contain the user (describe_user would fail as well)
+        if not identity_store_id or user_id == 'N/A' or self.identity_store_prefetched:
+            return placeholder
         
         try:
-            if not self.identitystore_client:
-                self.identitystore_client = self.session.client('identitystore')
-            
             response = self.identitystore_client.describe_user(
                 IdentityStoreId=identity_store_id,
                 UserId=user_id
             )
-            
-            # Extract relevant information
-            user_info = {
-                'username': response.get('UserName', 'N/A'),
-                'email': self._extract_email(response),
-                'display_name': response.get('DisplayName', 'N/A')
-            }
-            
-            # Cache the result
-            self.user_cache[user_id] = user_info
-            return user_info
-            
         except ClientError as e:
-            # Return placeholder on error
-            user_info = {
-                'username': user_id,
-                'email': 'N/A',
-                'display_name': 'N/A'
-            }
-            self.user_cache[user_id] = user_info
-            return user_info
+            _report_client_error(e, f"user {user_id}")
+            return placeholder
+        
+        # Extract relevant information
+        user_info = {
+            'username': response.get('UserName', 'N/A'),
+            'email': self._extract_email(response),
+            'display_name': response.get('DisplayName', 'N/A')
+        }
+        
+        with self._user_cache_lock:
+            self._save_cached_user(identity_store_id, user_id, user_info)
+        return user_info
+    
+    def _load_cached_users(self, identity_store_id):
+        """Seed the in-memory user cache from the on-disk store; return the number of users loaded"""
+        if not self.user_cache_store:
+            return 0
+        try:
+            cached = self.user_cache_store.load(identity_store_id, self.cache_ttl)
+        except sqlite3.Error:
+            return 0
+        with self._user_cache_lock:
+            self.user_cache.update(cached)
+        if cached:
+            print(f"👥 Loaded {len(cached)} cached user(s)\n")
+        return len(cached)
+    
+    def _save_cached_user(self, identity_store_id, user_id, user_info):
+        """Persist a successful user lookup, ignoring storage errors"""
+        self._save_cached_users(identity_store_id, {user_id: user_info})
+    
+    def _save_cached_users(self, identity_store_id, users):
+        """Persist successful user lookups, ignoring storage errors"""
+        if not self.user_cache_store or not users:
+            return
+        try:
+            self.user_cache_store.save(identity_store_id, users)
+        except sqlite3.Error:
+            pass
+    
+    def _prefetch_identity_store(self, identity_store_id):
+        """Load every user of the identity store with paged list_users calls"""
+        users = {}
+        try:
+            # The botocore paginator is used directly: under the async exporter this runs on a
+            # worker thread, where the overridden _paginate (an async generator) cannot be used
+            paginator = self.identitystore_client.get_paginator('list_users')
+            for page in paginator.paginate(IdentityStoreId=identity_store_id, PaginationConfig={'PageSize': 100}):
+                for user in page.get('Users', []):
+                    users[user['UserId']] = {
+                        'username': user.get('UserName', 'N/A'),
+                        'email': self._extract_email(user),
+                        'display_name': user.get('DisplayName', 'N/A')
+                    }
+        except ClientError as e:
+            print(f"⚠️  Could not list Identity Store users, looking them up individually: {e}")
+            return
+        
+        with self._user_cache_lock:
+            self.user_cache.update(users)
+            self.identity_store_prefetched = True
+        self._save_cached_users(identity_store_id, users)
+        print(f"👥 Prefetched {len(users)} user(s) from the Identity Store\n")
     
     def _extract_email(self, user_response):
         """Extract email from user response"""
@@ -180,35 +454,26 @@ class QBusinessGlobalExporterEnhanced:
     def list_applications(self):
         """Get all Q Business applications with details"""
         try:
-            if not self.qbusiness_client:
-                self.qbusiness_client = self.session.client('qbusiness')
-            
             print("🔍 Retrieving Q Business applications...\n")
             
             applications = []
-            next_token = None
             
-            while True:
-                params = {'maxResults': 50}
-                if next_token:
-                    params['nextToken'] = next_token
-                
-                response = self.qbusiness_client.list_applications(**params)
-                apps = response.get('applications', [])
-                
-                for app in apps:
-                    try:
-                        detail = self.qbusiness_client.get_application(
-                            applicationId=app['applicationId']
-                        )
-                        applications.append(detail)
-                    except ClientError as e:
-                        print(f"⚠️  Could not get details for {app['applicationId']}: {e}")
-                        applications.append(app)
-                
-                next_token = response.get('nextToken')
-                if not next_token:
-                    break
+            def fetch_detail(app):
+                try:
+                    return self.qbusiness_client.get_application(
+                        applicationId=app['applicationId']
+                    )
+                except ClientError as e:
+                    if _is_throttled(e):
+                        print(f"❌ Skipping {app['applicationId']}: {e}\n")
+                        self.skipped_apps.append(app['applicationId'])
+                        return None
+                    print(f"⚠️  Could not get details for {app['applicationId']}: {e}")
+                    return app
+            
+            for page in self._paginate(self.qbusiness_client, 'list_applications', 100):
+                details = self._fetch_details(page.get('applications', []), fetch_detail)
+                applications.extend(detail for detail in details if detail is not None)
             
             print(f"✅ Found {len(applications)} Q Business application(s)\n")
             return applications
@@ -219,144 +484,98 @@ class QBusinessGlobalExporterEnhanced:
     def get_qapps(self, application_id):
         """Get Q Apps for an application"""
         try:
-            if not self.qapps_client:
-                self.qapps_client = self.session.client('qapps')
-            
             qapps = []
-            next_token = None
             
-            while True:
-                params = {
-                    'instanceId': application_id,
-                    'limit': 100
-                }
-                if next_token:
-                    params['nextToken'] = next_token
-                
-                response = self.qapps_client.list_library_items(**params)
-                items = response.get('libraryItems', [])
-                
-                # Note: list_library_items does not return Q App title/name
-                # GetQApp and ListQApps APIs require owner permissions (UnauthorizedException)
-                # We use libraryItemId as identifier instead
-                for item in items:
-                    qapps.append(item)
-                
-                next_token = response.get('nextToken')
-                if not next_token:
-                    break
+            # Note: list_library_items does not return Q App title/name
+            # GetQApp and ListQApps APIs require owner permissions (UnauthorizedException)
+            # We use libraryItemId as identifier instead
+            for page in self._paginate(self.qapps_client, 'list_library_items', 100,
+                                       size_param='limit', instanceId=application_id):
+                qapps.extend(page.get('libraryItems', []))
             
             return qapps
-        except ClientError:
+        except ClientError as e:
+            _report_client_error(e, f"Q Apps of {application_id}")
             return []
     
+    def get_index_id(self, application_id):
+        """Get the ID of the application's first index"""
+        try:
+            indices = self.qbusiness_client.list_indices(
+                applicationId=application_id,
+                maxResults=100
+            )
+            if indices.get('indices'):
+                return indices['indices'][0]['indexId']
+        except ClientError as e:
+            _report_client_error(e, f"indices of {application_id}")
+        return None
+    
     def get_data_sources(self, application_id, index_id):
-        """Get data sources"""
+        """Get data sources (list summaries carry every exported field)"""
         try:
             data_sources = []
-            next_token = None
             
-            while True:
-                params = {
-                    'applicationId': application_id,
-                    'indexId': index_id,
-                    'maxResults': 10
-                }
-                if next_token:
-                    params['nextToken'] = next_token
-                
-                response = self.qbusiness_client.list_data_sources(**params)
-                sources = response.get('dataSources', [])
-                
-                for source in sources:
-                    try:
-                        detail = self.qbusiness_client.get_data_source(
-                            applicationId=application_id,
-                            indexId=index_id,
-                            dataSourceId=source['dataSourceId']
-                        )
-                        data_sources.append(detail)
-                    except ClientError:
-                        data_sources.append(source)
-                
-                next_token = response.get('nextToken')
-                if not next_token:
-                    break
+            # Service maximum for ListDataSources is 10 results per page
+            for page in self._paginate(self.qbusiness_client, 'list_data_sources', 10,
+                                       applicationId=application_id, indexId=index_id):
+                data_sources.extend(page.get('dataSources', []))
             
             return data_sources
-        except ClientError:
+        except ClientError as e:
+            _report_client_error(e, f"data sources of {application_id}")
             return []
     
     def get_retrievers(self, application_id):
-        """Get retrievers"""
+        """Get retrievers (list summaries carry every exported field)"""
         try:
             retrievers = []
-            next_token = None
             
-            while True:
-                params = {
-                    'applicationId': application_id,
-                    'maxResults': 50
-                }
-                if next_token:
-                    params['nextToken'] = next_token
-                
-                response = self.qbusiness_client.list_retrievers(**params)
-                ret_list = response.get('retrievers', [])
-                
-                for retriever in ret_list:
-                    try:
-                        detail = self.qbusiness_client.get_retriever(
-                            applicationId=application_id,
-                            retrieverId=retriever['retrieverId']
-                        )
-                        retrievers.append(detail)
-                    except ClientError:
-                        retrievers.append(retriever)
-                
-                next_token = response.get('nextToken')
-                if not next_token:
-                    break
+            for page in self._paginate(self.qbusiness_client, 'list_retrievers', 50,
+                                       applicationId=application_id):
+                retrievers.extend(page.get('retrievers', []))
             
             return retrievers
-        except ClientError:
+        except ClientError as e:
+            _report_client_error(e, f"retrievers of {application_id}")
             return []
     
     def get_plugins(self, application_id):
-        """Get plugins"""
+        """Get plugins (list summaries carry every exported field)"""
         try:
             plugins = []
-            next_token = None
             
-            while True:
-                params = {
-                    'applicationId': application_id,
-                    'maxResults': 50
-                }
-                if next_token:
-                    params['nextToken'] = next_token
-                
-                response = self.qbusiness_client.list_plugins(**params)
-                plugin_list = response.get('plugins', [])
-                
-                for plugin in plugin_list:
-                    try:
-                        detail = self.qbusiness_client.get_plugin(
-                            applicationId=application_id,
-                            pluginId=plugin['pluginId']
-                        )
-                        plugins.append(detail)
-                    except ClientError:
-                        plugins.append(plugin)
-                
-                next_token = response.get('nextToken')
-                if not next_token:
-                    break
+            for page in self._paginate(self.qbusiness_client, 'list_plugins', 50,
+                                       applicationId=application_id):
+                plugins.extend(page.get('plugins', []))
             
             return plugins
-        except ClientError:
+        except ClientError as e:
+            _report_client_error(e, f"plugins of {application_id}")
             return []
     
+    def _fetch_details(self, items, fetch_detail):
+        """Run fetch_detail over one page of list results on the shared pool, preserving order"""
+        return list(self._detail_pool.map(fetch_detail, items))
+    
+    def _paginate(self, client, operation, page_size, size_param='maxResults', **params):
+        """Yield result pages of a list operation, using the botocore paginator when available"""
+        if client.can_paginate(operation):
+            paginator = client.get_paginator(operation)
+            yield from paginator.paginate(PaginationConfig={'PageSize': page_size}, **params)
+            return
+        
+        # Fall back to a manual nextToken loop
+        method = getattr(client, operation)
+        params[size_param] = page_size
+        while True:
+            response = method(**params)
+            yield response
+            next_token = response.get('nextToken')
+            if not next_token:
+                break
+            params['nextToken'] = next_token
+    
     def get_chat_controls(self, application_id):
         """Get chat controls configuration"""
         try:
@@ -365,85 +584,137 @@ class QBusinessGlobalExporterEnhanced:
                 maxResults=50
             )
             return response
-        except ClientError:
+        except ClientError as e:
+            _report_client_error(e, f"chat controls of {application_id}")
             return {}
     
     def export_all_data(self):
         """Export complete Q Business data including Q Apps and configurations with user details"""
-        all_data = []
+        return list(self.iter_rows())
+    
+    def iter_rows(self):
+        """Yield data rows as each application finishes processing"""
         include_empty = self.config.get('export', {}).get('include_empty_apps', True)
+        self._export_ts = datetime.now().isoformat()
+        self.skipped_apps = []
         
         # Get all applications
         applications = self.list_applications()
+        self._prepare_identity_store(applications)
         
+        # Process applications concurrently; each progress block is printed once its application is done
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._process_application, app, include_empty): app
+                for app in applications
+            }
+            for future in as_completed(futures):
+                try:
+                    lines, rows = future.result()
+                except Exception as e:
+                    app_id = futures[future].get('applicationId', 'N/A')
+                    print(f"❌ Error processing {app_id}: {e}\n")
+                    self.skipped_apps.append(app_id)
+                    continue
+                print("\n".join(lines))
+                yield from rows
+    
+    def _prepare_identity_store(self, applications):
+        """Find the Identity Store of the first IAM IDC application and load its users (only once, before the workers start)"""
         for app in applications:
-            app_id = app.get('applicationId', 'N/A')
-            app_name = app.get('displayName', app_id)
-            
-            print(f"📊 Processing: {app_name}")
-            
-            # Get Identity Store ID if using IAM IDC (only once)
-            if not self.identity_store_id:
-                identity_type = app.get('identityType')
-                if identity_type == 'AWS_IAM_IDC':
-                    identity_center_arn = app.get('identityCenterApplicationArn')
-                    if identity_center_arn:
-                        self.identity_store_id = self.get_identity_store_id(identity_center_arn)
-            
-            # Get index ID
-            index_id = None
-            try:
-                indices = self.qbusiness_client.list_indices(
-                    applicationId=app_id,
-                    maxResults=10
-                )
-                if indices.get('indices'):
-                    index_id = indices['indices'][0]['indexId']
-            except ClientError:
-                pass
-            
-            # Get Q Apps
-            print(f"   📱 Retrieving Q Apps...")
-            qapps = self.get_qapps(app_id)
-            print(f"      ✅ Found {len(qapps)} Q App(s)")
-            
-            # Get data sources
-            data_sources = []
-            if index_id:
-                print(f"   📁 Retrieving data sources...")
-                data_sources = self.get_data_sources(app_id, index_id)
-                print(f"      ✅ Found {len(data_sources)} data source(s)")
-            
-            # Get retrievers
-            print(f"   🔍 Retrieving retrievers...")
-            retrievers = self.get_retrievers(app_id)
-            print(f"      ✅ Found {len(retrievers)} retriever(s)")
-            
-            # Get plugins
-            print(f"   🔌 Retrieving plugins...")
-            plugins = self.get_plugins(app_id)
-            print(f"      ✅ Found {len(plugins)} plugin(s)")
-            
-            # Get chat controls
-            print(f"   💬 Retrieving chat controls...")
-            chat_controls = self.get_chat_controls(app_id)
-            print(f"      ✅ Chat controls retrieved")
-            
-            # Create rows
-            if qapps:
-                for qapp in qapps:
-                    row = self._create_global_row(app, qapp, data_sources, retrievers, plugins, index_id, chat_controls)
-                    all_data.append(row)
-            elif include_empty:
-                row = self._create_global_row(app, None, data_sources, retrievers, plugins, index_id, chat_controls)
-                all_data.append(row)
-            
-            print()
+            identity_center_arn = app.get('identityCenterApplicationArn')
+            if app.get('identityType') == 'AWS_IAM_IDC' and identity_center_arn:
+                self.identity_store_id = self.get_identity_store_id(identity_center_arn)
+                if self.identity_store_id:
+                    # Warm runs use the on-disk cache; otherwise list the whole directory once
+                    if not self._load_cached_users(self.identity_store_id):
+                        self._prefetch_identity_store(self.identity_store_id)
+                    break
+    
+    def _process_application(self, app, include_empty):
+        """Retrieve Q Apps and configurations for one application; return its progress lines and rows"""
+        app_id = app.get('applicationId', 'N/A')
         
-        return all_data
+        # Index, Q Apps, retrievers, plugins and chat controls are independent;
+        # data sources are submitted as soon as the index is known
+        executor = self._call_pool
+        index_future = executor.submit(self.get_index_id, app_id)
+        qapps_future = executor.submit(self.get_qapps, app_id)
+        retrievers_future = executor.submit(self.get_retrievers, app_id)
+        plugins_future = executor.submit(self.get_plugins, app_id)
+        chat_controls_future = executor.submit(self.get_chat_controls, app_id)
+        
+        index_id = index_future.result()
+        data_sources_future = executor.submit(self.get_data_sources, app_id, index_id) if index_id else None
+        
+        qapps = qapps_future.result()
+        data_sources = data_sources_future.result() if data_sources_future else []
+        retrievers = retrievers_future.result()
+        plugins = plugins_future.result()
+        chat_controls = chat_controls_future.result()
+        
+        # Resolve the application's distinct creators and updaters up front, so building rows needs no I/O
+        self.resolve_users(self.identity_store_id, _qapp_user_ids(qapps))
+        
+        return self._build_application_rows(
+            app, qapps, data_sources, retrievers, plugins, index_id, chat_controls, include_empty
+        )
     
-    def _create_global_row(self, app, qapp, data_sources, retrievers, plugins, index_id, chat_controls):
-        """Create comprehensive data row with user details"""
+    def _build_application_rows(self, app, qapps, data_sources, retrievers, plugins, index_id, chat_controls,
+                                include_empty):
+        """Build one application's progress lines and rows from its retrieved data"""
+        app_name = app.get('displayName', app.get('applicationId', 'N/A'))
+        
+        lines = [f"📊 Processing: {app_name}"]
+        lines.append(f"   📱 Found {len(qapps)} Q App(s)")
+        if index_id:
+            lines.append(f"   📁 Found {len(data_sources)} data source(s)")
+        lines.append(f"   🔍 Found {len(retrievers)} retriever(s)")
+        lines.append(f"   🔌 Found {len(plugins)} plugin(s)")
+        lines.append(f"   💬 Chat controls retrieved")
+        lines.append("")
+        
+        # Create rows from a template holding the columns shared by all of the application's Q Apps
+        row_template = _ROW_TEMPLATE.copy()
+        row_template.update(self._create_app_fields(app, data_sources, retrievers, plugins, index_id, chat_controls))
+        rows = []
+        if qapps:
+            for qapp in qapps:
+                rows.append(self._create_global_row(qapp, row_template))
+        elif include_empty:
+            rows.append(self._create_global_row(None, row_template))
+        
+        return lines, rows
+    
+    def _create_global_row(self, qapp, row_template):
+        """Create comprehensive data row with user details from the application's prefilled row template"""
+        has_qapp = bool(qapp)
+        qapp = qapp or {}
+        
+        # Copying the template keeps the column order and never resizes the dict
+        row = row_template.copy()
+        row.update({column: qapp.get(key, default) for column, key, default in _QAPP_FIELD_MAP})
+        
+        # ===== Q APP INFORMATION (Primary) =====
+        # Note: Q App title not accessible via API - using libraryItemId as fallback
+        row['qapp_name'] = f"Q App {qapp.get('libraryItemId', 'Unknown')}" if has_qapp else 'No Q Apps'
+        row['qapp_created_at'] = str(qapp.get('createdAt', 'N/A'))
+        row['qapp_updated_at'] = str(qapp.get('updatedAt', 'N/A'))
+        row['qapp_categories'] = ', '.join([cat.get('title', '') for cat in qapp.get('categories', [])]) if has_qapp else 'N/A'
+        
+        # ===== Q APP CREATOR / UPDATER DETAILS (ENHANCED) =====
+        creator_info = self.get_user_details(self.identity_store_id, row['qapp_creator_user_id'])
+        updater_info = self.get_user_details(self.identity_store_id, row['qapp_updater_user_id'])
+        row['qapp_creator_username'] = creator_info['username']
+        row['qapp_creator_email'] = creator_info['email']
+        row['qapp_creator_display_name'] = creator_info['display_name']
+        row['qapp_updater_username'] = updater_info['username']
+        row['qapp_updater_email'] = updater_info['email']
+        
+        return row
+    
+    def _create_app_fields(self, app, data_sources, retrievers, plugins, index_id, chat_controls):
+        """Create the application columns shared by all of an application's rows"""
         
         # Extract app configurations
         attachments = app.get('attachmentsConfiguration', {})
@@ -453,49 +724,19 @@ class QBusinessGlobalExporterEnhanced:
         quicksight_config = app.get('quickSightConfiguration', {})
         
         # Extract chat controls
-        blocked_phrases_config = chat_controls.get('blockedPhrases', {}) if chat_controls else {}
-        creator_mode = chat_controls.get('creatorModeConfiguration', {}) if chat_controls else {}
-        hallucination_reduction = chat_controls.get('hallucinationReductionConfiguration', {}) if chat_controls else {}
-        orchestration = chat_controls.get('orchestrationConfiguration', {}) if chat_controls else {}
-        topic_configs = chat_controls.get('topicConfigurations', []) if chat_controls else []
-        
-        # Get user details for creator and updater
-        creator_id = qapp.get('createdBy', 'N/A') if qapp else 'N/A'
-        updater_id = qapp.get('updatedBy', 'N/A') if qapp else 'N/A'
-        
-        creator_info = self.get_user_details(self.identity_store_id, creator_id)
-        updater_info = self.get_user_details(self.identity_store_id, updater_id)
-        
-        row = {
-            # ===== Q APP INFORMATION (Primary) =====
-            # Note: Q App title not accessible via API - using libraryItemId as fallback
-            'qapp_name': f"Q App {qapp.get('libraryItemId', 'Unknown')}" if qapp else 'No Q Apps',
-            'qapp_id': qapp.get('appId', 'N/A') if qapp else 'N/A',
-            'qapp_library_item_id': qapp.get('libraryItemId', 'N/A') if qapp else 'N/A',
-            'qapp_version': qapp.get('appVersion', 'N/A') if qapp else 'N/A',
-            'qapp_status': qapp.get('status', 'N/A') if qapp else 'N/A',
-            'qapp_user_count': qapp.get('userCount', 0) if qapp else 0,
-            
-            # ===== Q APP CREATOR DETAILS (ENHANCED) =====
-            'qapp_creator_user_id': creator_id,
-            'qapp_creator_username': creator_info['username'],
-            'qapp_creator_email': creator_info['email'],
-            'qapp_creator_display_name': creator_info['display_name'],
-            'qapp_created_at': str(qapp.get('createdAt', 'N/A')) if qapp else 'N/A',
-            
-            # ===== Q APP UPDATER DETAILS (ENHANCED) =====
-            'qapp_updater_user_id': updater_id,
-            'qapp_updater_username': updater_info['username'],
-            'qapp_updater_email': updater_info['email'],
-            'qapp_updated_at': str(qapp.get('updatedAt', 'N/A')) if qapp else 'N/A',
-            
-            # ===== Q APP ADDITIONAL METADATA =====
-            'qapp_rating_count': qapp.get('ratingCount', 0) if qapp else 0,
-            'qapp_is_verified': qapp.get('isVerified', False) if qapp else False,
-            'qapp_is_rated_by_user': qapp.get('isRatedByUser', False) if qapp else False,
-            'qapp_description': qapp.get('description', 'N/A') if qapp else 'N/A',
-            'qapp_categories': ', '.join([cat.get('title', '') for cat in qapp.get('categories', [])]) if qapp else 'N/A',
-            
+        chat_controls = chat_controls or {}
+        blocked_phrases_config = chat_controls.get('blockedPhrases', {})
+        creator_mode = chat_controls.get('creatorModeConfiguration', {})
+        hallucination_reduction = chat_controls.get('hallucinationReductionConfiguration', {})
+        orchestration = chat_controls.get('orchestrationConfiguration', {})
+        topic_configs = chat_controls.get('topicConfigurations', [])
+        
+        # Join list attributes once per collection
+        ds = _collect(data_sources, 'dataSourceId', 'type', 'displayName', 'status')
+        ret = _collect(retrievers, 'retrieverId', 'type', 'status')
+        plg = _collect(plugins, 'pluginId', 'type', 'status')
+        
+        return {
             # ===== APPLICATION BASIC INFO =====
             'app_name': app.get('displayName', 'N/A'),
             'app_id': app.get('applicationId', 'N/A'),
@@ -531,7 +772,7 @@ class QBusinessGlobalExporterEnhanced:
             'creator_mode_control': creator_mode.get('creatorModeControl', 'N/A'),
             'hallucination_reduction_control': hallucination_reduction.get('hallucinationReductionControl', 'N/A'),
             'orchestration_control': orchestration.get('control', 'N/A'),
-            'response_scope': chat_controls.get('responseScope', 'N/A') if chat_controls else 'N/A',
+            'response_scope': chat_controls.get('responseScope', 'N/A'),
             
             # ===== CHAT CONTROLS - TOPICS =====
             'topic_count': len(topic_configs),
@@ -547,30 +788,95 @@ class QBusinessGlobalExporterEnhanced:
             
             # ===== DATA SOURCES =====
             'data_source_count': len(data_sources),
-            'data_source_ids': ', '.join([ds.get('dataSourceId', 'N/A') for ds in data_sources]),
-            'data_source_types': ', '.join([ds.get('type', 'N/A') for ds in data_sources]),
-            'data_source_names': ', '.join([ds.get('displayName', 'N/A') for ds in data_sources]),
-            'data_source_statuses': ', '.join([ds.get('status', 'N/A') for ds in data_sources]),
+            'data_source_ids': ds['dataSourceId'],
+            'data_source_types': ds['type'],
+            'data_source_names': ds['displayName'],
+            'data_source_statuses': ds['status'],
             
             # ===== RETRIEVERS =====
             'retriever_count': len(retrievers),
-            'retriever_ids': ', '.join([r.get('retrieverId', 'N/A') for r in retrievers]),
-            'retriever_types': ', '.join([r.get('type', 'N/A') for r in retrievers]),
-            'retriever_statuses': ', '.join([r.get('status', 'N/A') for r in retrievers]),
+            'retriever_ids': ret['retrieverId'],
+            'retriever_types': ret['type'],
+            'retriever_statuses': ret['status'],
             
             # ===== PLUGINS =====
             'plugin_count': len(plugins),
-            'plugin_ids': ', '.join([p.get('pluginId', 'N/A') for p in plugins]),
-            'plugin_types': ', '.join([p.get('type', 'N/A') for p in plugins]),
-            'plugin_statuses': ', '.join([p.get('status', 'N/A') for p in plugins]),
+            'plugin_ids': plg['pluginId'],
+            'plugin_types': plg['type'],
+            'plugin_statuses': plg['status'],
             
             # ===== METADATA =====
-            'export_timestamp': datetime.now().isoformat(),
+            'export_timestamp': self._export_ts,
             'aws_region': self.aws_region,
             'aws_account': self.expected_account or 'N/A',
         }
+    
+    def export_rows(self, rows, basename=None):
+        """Stream rows to CSV and a JSON array as they arrive and return summary counts"""
+        summary = {'rows': 0, 'app_ids': set(), 'qapps': 0, 'creators': Counter(), 'write_failed': False}
         
-        return row
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return summary
+        
+        # Use src/qapp_info_retrival/output directory
+        script_dir = Path(__file__).parent
+        output_dir = script_dir / 'output'
+        output_dir.mkdir(exist_ok=True)
+        
+        if not basename:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            basename = f"qbusiness_global_enhanced_{timestamp}"
+        
+        csv_path = output_dir / f"{basename}.csv"
+        json_path = output_dir / f"{basename}.json"
+        
+        print("=" * 100)
+        print("📊 EXPORTING DATA")
+        print("=" * 100)
+        print()
+        
+        try:
+            with ExitStack() as stack:
+                csv_file = stack.enter_context(
+                    open(csv_path, 'w', newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+                )
+                json_file = stack.enter_context(
+                    open(json_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+                )
+                
+                writer = csv.writer(csv_file)
+                writer.writerow(FIELDNAMES)
+                json_file.write('[')
+                
+                for row in itertools.chain([first], rows):
+                    writer.writerow(_project_row(row))
+                    
+                    # Same layout as json.dump(data, indent=2), one element at a time
+                    json_file.write(',\n' if summary['rows'] else '\n')
+                    json_file.write(textwrap.indent(_to_json(row), '  '))
+                    
+                    summary['rows'] += 1
+                    summary['app_ids'].add(row['app_id'])
+                    if row['qapp_id'] != 'N/A':
+                        summary['qapps'] += 1
+                    if row['qapp_creator_email'] != 'N/A':
+                        summary['creators'][row['qapp_creator_email']] += 1
+                
+                json_file.write('\n]')
+            
+            print(f"\n✅ CSV exported to: {csv_path}")
+            print(f"   Total rows: {summary['rows']}")
+            print(f"   Total columns: {len(FIELDNAMES)}")
+            print(f"✅ JSON exported to: {json_path}")
+            
+        except OSError as e:
+            # Only file errors are handled here; AWS errors raised by the row generator propagate
+            print(f"❌ Error writing export files: {e}")
+            summary['write_failed'] = True
+        
+        return summary
     
     def export_to_csv(self, data, filename=None):
         """Export to CSV"""
@@ -590,16 +896,14 @@ class QBusinessGlobalExporterEnhanced:
         output_path = output_dir / filename
         
         try:
-            fieldnames = list(data[0].keys())
-            
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(FIELDNAMES)
+                writer.writerows(map(_project_row, data))
             
             print(f"\n✅ CSV exported to: {output_path}")
             print(f"   Total rows: {len(data)}")
-            print(f"   Total columns: {len(fieldnames)}")
+            print(f"   Total columns: {len(FIELDNAMES)}")
             
         except Exception as e:
             print(f"❌ Error exporting CSV: {e}")
@@ -621,8 +925,8 @@ class QBusinessGlobalExporterEnhanced:
         output_path = output_dir / filename
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+                f.write(_to_json(data))
             
             print(f"✅ JSON exported to: {output_path}")
             
@@ -630,6 +934,310 @@ class QBusinessGlobalExporterEnhanced:
             print(f"❌ Error exporting JSON: {e}")
 
 
+class AsyncQBusinessGlobalExporterEnhanced(QBusinessGlobalExporterEnhanced):
+    """Asynchronous variant of the enhanced exporter built on aioboto3
+    
+    A single qbusiness, qapps and identitystore client is opened for the whole export
+    and shared by every coroutine; an asyncio.Semaphore bounds the number of in-flight calls.
+    """
+    
+    def __init__(self, config_path='./input/config.yml', env_path='./config/.env', cache_ttl=USER_CACHE_TTL_SECONDS,
+                 jobs=None):
+        """Initialize the exporter with configuration"""
+        if aioboto3 is None:
+            raise ImportError("aioboto3 is required for AsyncQBusinessGlobalExporterEnhanced")
+        super().__init__(config_path, env_path, cache_ttl=cache_ttl)
+        
+        session_params = {'region_name': self.aws_region}
+        if self.aws_profile:
+            session_params['profile_name'] = self.aws_profile
+        self.async_session = aioboto3.Session(**session_params)
+        self.concurrency = jobs or self.config.get('retrieval', {}).get('async_concurrency', 32)
+        
+        self._exit_stack = None
+        self._semaphore = None
+        self._qbusiness = None
+        self._qapps = None
+        self._identitystore = None
+        
+        # Users fetched one by one during the export, written to the user cache in one batch afterwards
+        self._fetched_users = {}
+    
+    async def __aenter__(self):
+        """Open the shared async clients"""
+        self._exit_stack = AsyncExitStack()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._qbusiness = await self._exit_stack.enter_async_context(
+            self.async_session.client('qbusiness', config=self._client_config)
+        )
+        self._qapps = await self._exit_stack.enter_async_context(
+            self.async_session.client('qapps', config=self._client_config)
+        )
+        self._identitystore = await self._exit_stack.enter_async_context(
+            self.async_session.client('identitystore', config=self._client_config)
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared async clients"""
+        await self._exit_stack.aclose()
+        self._exit_stack = None
+    
+    async def _call(self, method, **params):
+        """Issue one API call, bounded by the concurrency semaphore"""
+        async with self._semaphore:
+            return await method(**params)
+    
+    async def _paginate(self, client, operation, page_size, size_param='maxResults', **params):
+        """Yield result pages of a list operation, using the aiobotocore paginator when available"""
+        if client.can_paginate(operation):
+            paginator = client.get_paginator(operation)
+            pages = paginator.paginate(PaginationConfig={'PageSize': page_size}, **params).__aiter__()
+            while True:
+                # Each page is one API call, so it counts against the concurrency limit too
+                async with self._semaphore:
+                    try:
+                        page = await pages.__anext__()
+                    except StopAsyncIteration:
+                        return
+                yield page
+        
+        # Fall back to a manual nextToken loop
+        method = getattr(client, operation)
+        params[size_param] = page_size
+        while True:
+            response = await self._call(method, **params)
+            yield response
+            next_token = response.get('nextToken')
+            if not next_token:
+                break
+            params['nextToken'] = next_token
+    
+    async def list_applications(self):
+        """Get all Q Business applications with details"""
+        try:
+            print("🔍 Retrieving Q Business applications...\n")
+            
+            applications = []
+            
+            async def fetch_detail(app):
+                try:
+                    return await self._call(
+                        self._qbusiness.get_application,
+                        applicationId=app['applicationId']
+                    )
+                except ClientError as e:
+                    if _is_throttled(e):
+                        print(f"❌ Skipping {app['applicationId']}: {e}\n")
+                        self.skipped_apps.append(app['applicationId'])
+                        return None
+                    print(f"⚠️  Could not get details for {app['applicationId']}: {e}")
+                    return app
+            
+            async for page in self._paginate(self._qbusiness, 'list_applications', 100):
+                details = await asyncio.gather(*(fetch_detail(app) for app in page.get('applications', [])))
+                applications.extend(detail for detail in details if detail is not None)
+            
+            print(f"✅ Found {len(applications)} Q Business application(s)\n")
+            return applications
+        except ClientError as e:
+            print(f"❌ Error listing applications: {e}")
+            return []
+    
+    async def get_qapps(self, application_id):
+        """Get Q Apps for an application"""
+        try:
+            qapps = []
+            async for page in self._paginate(self._qapps, 'list_library_items', 100,
+                                             size_param='limit', instanceId=application_id):
+                qapps.extend(page.get('libraryItems', []))
+            return qapps
+        except ClientError as e:
+            _report_client_error(e, f"Q Apps of {application_id}")
+            return []
+    
+    async def get_index_id(self, application_id):
+        """Get the ID of the application's first index"""
+        try:
+            indices = await self._call(
+                self._qbusiness.list_indices,
+                applicationId=application_id,
+                maxResults=100
+            )
+            if indices.get('indices'):
+                return indices['indices'][0]['indexId']
+        except ClientError as e:
+            _report_client_error(e, f"indices of {application_id}")
+        return None
+    
+    async def get_data_sources(self, application_id, index_id):
+        """Get data sources (list summaries carry every exported field)"""
+        try:
+            data_sources = []
+            # Service maximum for ListDataSources is 10 results per page
+            async for page in self._paginate(self._qbusiness, 'list_data_sources', 10,
+                                             applicationId=application_id, indexId=index_id):
+                data_sources.extend(page.get('dataSources', []))
+            return data_sources
+        except ClientError as e:
+            _report_client_error(e, f"data sources of {application_id}")
+            return []
+    
+    async def get_retrievers(self, application_id):
+        """Get retrievers (list summaries carry every exported field)"""
+        try:
+            retrievers = []
+            async for page in self._paginate(self._qbusiness, 'list_retrievers', 50,
+                                             applicationId=application_id):
+                retrievers.extend(page.get('retrievers', []))
+            return retrievers
+        except ClientError as e:
+            _report_client_error(e, f"retrievers of {application_id}")
+            return []
+    
+    async def get_plugins(self, application_id):
+        """Get plugins (list summaries carry every exported field)"""
+        try:
+            plugins = []
+            async for page in self._paginate(self._qbusiness, 'list_plugins', 50,
+                                             applicationId=application_id):
+                plugins.extend(page.get('plugins', []))
+            return plugins
+        except ClientError as e:
+            _report_client_error(e, f"plugins of {application_id}")
+            return []
+    
+    async def get_chat_controls(self, application_id):
+        """Get chat controls configuration"""
+        try:
+            return await self._call(
+                self._qbusiness.get_chat_controls_configuration,
+                applicationId=application_id,
+                maxResults=50
+            )
+        except ClientError as e:
+            _report_client_error(e, f"chat controls of {application_id}")
+            return {}
+    
+    def get_user_details(self, identity_store_id, user_id):
+        """Get user details already resolved by resolve_users_async, without blocking the event loop"""
+        # Every Q App user is resolved before the application's rows are built, so a miss
+        # (only ever 'N/A') gets the placeholder instead of a lookup on the thread pool
+        user_info = self.user_cache.get(user_id)
+        if user_info is None:
+            return _user_placeholder(user_id)
+        return user_info
+    
+    async def resolve_users_async(self, identity_store_id, user_ids):
+        """Get details for several users, fetching each unknown user only once"""
+        user_ids = set(user_ids)
+        
+        # Claims happen without awaiting, so coroutines cannot interleave between check and claim
+        pending = {}
+        for user_id in user_ids - self.user_cache.keys():
+            if user_id not in self._pending_users:
+                self._pending_users[user_id] = asyncio.ensure_future(
+                    self._fetch_user_details_async(identity_store_id, user_id)
+                )
+            pending[user_id] = self._pending_users[user_id]
+        
+        for user_id, task in pending.items():
+            try:
+                self.user_cache[user_id] = await task
+            finally:
+                # On failure a later application retries the lookup
+                self._pending_users.pop(user_id, None)
+        
+        return {user_id: self.user_cache[user_id] for user_id in user_ids}
+    
+    async def _fetch_user_details_async(self, identity_store_id, user_id):
+        """Fetch one user from the Identity Store, returning a placeholder if it cannot be resolved"""
+        placeholder = _user_placeholder(user_id)
+        
+        # Skip if no identity store or invalid user_id, or if the prefetched
+        # directory does not contain the user (describe_user would fail as well)
+        if not identity_store_id or user_id == 'N/A' or self.identity_store_prefetched:
+            return placeholder
+        
+        try:
+            response = await self._call(
+                self._identitystore.describe_user,
+                IdentityStoreId=identity_store_id,
+                UserId=user_id
+            )
+        except ClientError as e:
+            _report_client_error(e, f"user {user_id}")
+            return placeholder
+        
+        user_info = {
+            'username': response.get('UserName', 'N/A'),
+            'email': self._extract_email(response),
+            'display_name': response.get('DisplayName', 'N/A')
+        }
+        self._fetched_users[user_id] = user_info
+        return user_info
+    
+    def iter_rows(self):
+        """Yield data rows once the asynchronous export has completed"""
+        yield from asyncio.run(self.export_all_data_async())
+    
+    async def export_all_data_async(self):
+        """Export complete Q Business data including Q Apps and configurations with user details"""
+        include_empty = self.config.get('export', {}).get('include_empty_apps', True)
+        self._export_ts = datetime.now().isoformat()
+        self.skipped_apps = []
+        self._fetched_users = {}
+        
+        async with self:
+            applications = await self.list_applications()
+            # Identity Store discovery and the user prefetch are one-off synchronous calls
+            await asyncio.to_thread(self._prepare_identity_store, applications)
+            results = await asyncio.gather(
+                *(self._process_application(app, include_empty) for app in applications),
+                return_exceptions=True
+            )
+        
+        # SQLite writes would block the event loop, so the lookups are saved in one batch on a thread
+        await asyncio.to_thread(self._save_cached_users, self.identity_store_id, self._fetched_users)
+        
+        all_data = []
+        for app, result in zip(applications, results):
+            if isinstance(result, Exception):
+                print(f"❌ Error processing {app.get('applicationId', 'N/A')}: {result}\n")
+                self.skipped_apps.append(app.get('applicationId', 'N/A'))
+                continue
+            lines, rows = result
+            print("\n".join(lines))
+            all_data.extend(rows)
+        
+        return all_data
+    
+    async def _process_application(self, app, include_empty):
+        """Retrieve Q Apps and configurations for one application; return its progress lines and rows"""
+        app_id = app.get('applicationId', 'N/A')
+        
+        async def get_index_data_sources():
+            index_id = await self.get_index_id(app_id)
+            data_sources = await self.get_data_sources(app_id, index_id) if index_id else []
+            return index_id, data_sources
+        
+        # Index (then its data sources), Q Apps, retrievers, plugins and chat controls are independent
+        (index_id, data_sources), qapps, retrievers, plugins, chat_controls = await asyncio.gather(
+            get_index_data_sources(),
+            self.get_qapps(app_id),
+            self.get_retrievers(app_id),
+            self.get_plugins(app_id),
+            self.get_chat_controls(app_id)
+        )
+        
+        # Resolve the application's distinct creators and updaters up front, so building rows needs no I/O
+        await self.resolve_users_async(self.identity_store_id, _qapp_user_ids(qapps))
+        
+        return self._build_application_rows(
+            app, qapps, data_sources, retrievers, plugins, index_id, chat_controls, include_empty
+        )
+
+
 def main():
     """Main execution"""
     parser = argparse.ArgumentParser(
@@ -637,6 +1245,12 @@ def main():
     )
     parser.add_argument('--config', default='./input/config.yml', help='Path to config YAML')
     parser.add_argument('--env', default='./config/.env', help='Path to .env file')
+    parser.add_argument('--cache-ttl', type=int, default=USER_CACHE_TTL_SECONDS,
+                        help='Seconds a cached user lookup stays valid (0 disables the user cache)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Use the aioboto3 asynchronous exporter (falls back to threads if not installed)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Applications processed concurrently, or in-flight API calls with --async')
     
     args = parser.parse_args()
     
@@ -652,49 +1266,62 @@ def main():
     
     # Initialize
     print("🔧 Initializing...")
-    exporter = QBusinessGlobalExporterEnhanced(args.config, args.env)
+    if args.use_async and aioboto3 is None:
+        print("⚠️  aioboto3 is not installed; using the threaded exporter")
+    if args.use_async and aioboto3 is not None:
+        exporter = AsyncQBusinessGlobalExporterEnhanced(args.config, args.env, cache_ttl=args.cache_ttl, jobs=args.jobs)
+    else:
+        exporter = QBusinessGlobalExporterEnhanced(args.config, args.env, cache_ttl=args.cache_ttl, jobs=args.jobs)
     
     # Verify credentials
     if not exporter.verify_credentials():
         print("❌ Exiting due to credential issues")
-        return
+        exporter.close()
+        sys.exit(1)
     
     print("🚀 Starting global data export with user details...\n")
     
-    # Export all data
-    data = exporter.export_all_data()
+    # Export all data, writing rows to disk as each application completes
+    try:
+        summary = exporter.export_rows(exporter.iter_rows())
+    except (BotoCoreError, ClientError) as e:
+        # Rows are fetched while the files are written, so the output on disk is truncated
+        print(f"❌ Export failed, output files are incomplete: {e}")
+        sys.exit(1)
+    finally:
+        exporter.close()
     
-    if data:
-        print("=" * 100)
-        print("📊 EXPORTING DATA")
-        print("=" * 100)
-        print()
-        
-        # Export
-        exporter.export_to_csv(data)
-        exporter.export_to_json(data)
-        
+    if summary['write_failed']:
+        sys.exit(1)
+    
+    if summary['rows']:
         # User summary
         print("\n" + "=" * 100)
         print("👥 USER SUMMARY")
         print("=" * 100)
-        unique_creators = set(d['qapp_creator_email'] for d in data if d['qapp_creator_email'] != 'N/A')
-        print(f"   Unique Q App Creators: {len(unique_creators)}")
-        for email in sorted(unique_creators):
-            creator_apps = [d for d in data if d['qapp_creator_email'] == email]
-            print(f"   - {email}: {len(creator_apps)} Q App(s)")
+        print(f"   Unique Q App Creators: {len(summary['creators'])}")
+        for email in sorted(summary['creators']):
+            print(f"   - {email}: {summary['creators'][email]} Q App(s)")
         
         print("\n" + "=" * 100)
         print("📈 SUMMARY")
         print("=" * 100)
-        print(f"   Total Records: {len(data)}")
-        print(f"   Q Business Applications: {len(set([d['app_id'] for d in data]))}")
-        print(f"   Q Apps Found: {sum(1 for d in data if d['qapp_id'] != 'N/A')}")
+        print(f"   Total Records: {summary['rows']}")
+        print(f"   Q Business Applications: {len(summary['app_ids'])}")
+        print(f"   Q Apps Found: {summary['qapps']}")
+        print(f"   Skipped Applications: {len(exporter.skipped_apps)}")
         print(f"   Output Directory: ./output/")
         print("=" * 100)
-        print("\n✅ Done!")
     else:
         print("⚠️  No data found to export")
+    
+    if exporter.skipped_apps:
+        print(f"\n❌ Export incomplete: {len(exporter.skipped_apps)} application(s) skipped: "
+              f"{', '.join(exporter.skipped_apps)}")
+        sys.exit(1)
+    
+    if summary['rows']:
+        print("\n✅ Done!")
 
 
 if __name__ == "__main__":